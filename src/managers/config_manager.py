@@ -10,13 +10,17 @@ import/export functionality and maintains backward compatibility.
 
 import os
 import sys
+import copy
 import json
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, List, Tuple
 from src.utils.constants import (
     CONFIG_DIR_WINDOWS, CONFIG_DIR_UNIX, CONFIG_FILENAME,
     MIN_WINDOW_WIDTH, MIN_WINDOW_HEIGHT, MAX_WINDOW_WIDTH, MAX_WINDOW_HEIGHT
 )
 
+# Marks a key that is absent from the configuration
+_MISSING = object()
+
 
 class ConfigManager:
     """
@@ -49,6 +53,7 @@ class ConfigManager:
         },
         "display": {
             "refresh_rate": 500,         # Default refresh rate (ms)
+            "max_lines": 0,              # Lines kept in the view (0 = unlimited)
     
             "auto_scroll": True,         # Auto-scroll by default
             "word_wrap": False,          # Word wrap by default
@@ -90,7 +95,7 @@ class ConfigManager:
         self.config_file = os.path.join(config_dir, CONFIG_FILENAME)
         print(f"Debug: Config directory: {self.config_dir}")
         print(f"Debug: Config file: {self.config_file}")
-        self.config = self.DEFAULT_CONFIG.copy()
+        self.config = copy.deepcopy(self.DEFAULT_CONFIG)
         self.load_config()
     
     def load_config(self):
@@ -189,6 +194,31 @@ class ConfigManager:
         except (KeyError, TypeError):
             return default
     
+    def get_many(self, specs: Iterable[Tuple[str, Any]]) -> Dict[str, Any]:
+        """
+        Get several configuration values using dot notation.
+        
+        Args:
+            specs: (key_path, default) pairs
+            
+        Returns:
+            Dict mapping each key path to its value or default
+            
+        Example:
+            config.get_many([('window.width', 800), ('window.height', 600)])
+        """
+        config = self.config
+        values = {}
+        for key_path, default in specs:
+            value = config
+            try:
+                for key in key_path.split('.'):
+                    value = value[key]
+            except (KeyError, TypeError):
+                value = default
+            values[key_path] = value
+        return values
+    
     def set(self, key_path: str, value):
         """
         Set configuration value using dot notation.
@@ -212,6 +242,26 @@ class ConfigManager:
         # Set the value
         config[keys[-1]] = value
     
+    def update(self, values: Dict[str, Any]) -> List[str]:
+        """
+        Set several configuration values at once using dot notation.
+        
+        Values equal to the current setting are skipped. Like set(), this
+        does not write the file; call save_config() once afterwards.
+        
+        Args:
+            values: Mapping of key paths (e.g., 'window.width') to values
+            
+        Returns:
+            List of key paths whose value actually changed
+        """
+        changed = []
+        for key_path, value in values.items():
+            if self.get(key_path, _MISSING) != value:
+                self.set(key_path, value)
+                changed.append(key_path)
+        return changed
+    
     def get_window_geometry(self) -> str:
         """
         Get window geometry string for Tkinter.
@@ -303,10 +353,16 @@ class ConfigManager:
             self.set('window.y', None)
             self.set('window.maximized', False)
     
-    def reset_to_defaults(self):
-        """Reset configuration to default values and save to file."""
-        self.config = self.DEFAULT_CONFIG.copy()
+    def reset_to_defaults(self) -> Dict[str, Any]:
+        """
+        Reset configuration to default values and save to file.
+        
+        Returns:
+            The new configuration dictionary
+        """
+        self.config = copy.deepcopy(self.DEFAULT_CONFIG)
         self.save_config()
+        return self.config
     
     def export_config(self, filepath: str):
         """
@@ -9,9 +9,117 @@ for real-time log monitoring with minimal resource usage.
 """
 
 import os
-import io
+import sys
+import mmap
+import time
+import codecs
+import struct
 from typing import Optional
-from src.utils.constants import DEFAULT_ENCODING
+from src.utils.constants import (
+    DEFAULT_ENCODING, ENCODING_SNIFF_BYTES, MMAP_READ_THRESHOLD,
+    FILE_WATCH_FALLBACK_SECONDS, PROGRESS_REPORT_BYTES, ROTATION_CHECK_SECONDS,
+    DIRECT_READ_THRESHOLD
+)
+from src.utils.formatting import format_size
+
+if hasattr(os, "pread"):
+    _pread = os.pread
+else:
+    def _pread(fd: int, length: int, offset: int) -> bytes:
+        """Positional read fallback for platforms without os.pread (Windows)."""
+        os.lseek(fd, offset, os.SEEK_SET)
+        return os.read(fd, length)
+
+
+class _InotifyWatch:
+    """
+    Non-blocking inotify watch on a log file and its directory (Linux only).
+    
+    Lets the file manager skip all stat and read syscalls while the file
+    is idle. The file itself is watched for writes, truncation and being
+    moved or deleted; its directory is watched for a replacement file
+    appearing under the same name after rotation.
+    """
+    
+    # inotify(7) event masks and flags
+    IN_MODIFY = 0x00000002
+    IN_ATTRIB = 0x00000004
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE_SELF = 0x00000400
+    IN_MOVE_SELF = 0x00000800
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+    
+    FILE_MASK = IN_MODIFY | IN_ATTRIB | IN_DELETE_SELF | IN_MOVE_SELF
+    DIR_MASK = IN_CREATE | IN_MOVED_TO
+    # Events after which the path may name a different file than the one open
+    PATH_MASK = IN_ATTRIB | IN_DELETE_SELF | IN_MOVE_SELF | IN_CREATE | IN_MOVED_TO
+    
+    # struct inotify_event header: wd, mask, cookie, len (name follows)
+    _EVENT_HEADER = struct.Struct("iIII")
+    
+    def __init__(self, path: str):
+        """
+        Create the watch.
+        
+        Args:
+            path: Path of the file to watch
+            
+        Raises:
+            OSError: If inotify is unavailable or the watch cannot be added
+        """
+        import ctypes
+        import ctypes.util
+        
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        
+        self._fd = libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        
+        directory = os.path.dirname(os.path.abspath(path))
+        for target, mask in ((path, self.FILE_MASK), (directory, self.DIR_MASK)):
+            if libc.inotify_add_watch(self._fd, os.fsencode(target), mask) < 0:
+                errno = ctypes.get_errno()
+                self.close()
+                raise OSError(errno, f"inotify_add_watch failed for {target}")
+    
+    def fileno(self) -> int:
+        """Return the inotify file descriptor (readable when events are pending)."""
+        return self._fd
+    
+    def read_events(self) -> int:
+        """
+        Drain pending events without blocking.
+        
+        Returns:
+            The event masks seen since the last call OR'ed together
+            (0 if nothing happened)
+        """
+        header = self._EVENT_HEADER
+        mask = 0
+        try:
+            while True:
+                data = os.read(self._fd, 4096)
+                if not data:
+                    break
+                offset = 0
+                while offset + header.size <= len(data):
+                    _, event_mask, _, name_len = header.unpack_from(data, offset)
+                    mask |= event_mask
+                    offset += header.size + name_len
+        except BlockingIOError:
+            pass
+        return mask
+    
+    def close(self):
+        """Close the inotify descriptor."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
 
 
 class FileManager:
@@ -33,12 +141,20 @@ class FileManager:
         """
         self.path = path
         self.encoding = encoding
+        self._auto_detect = encoding == "auto"  # Detect encoding from content
         self._fh = None  # File handle for reading
+        self._fd = -1  # Descriptor of _fh, cached for the per-tick syscalls
         self._inode = None  # File inode for detecting rotation
+        self._ctime_ns = None  # Status change time seen at the last check
         self._pos = 0  # Current file position
         self._detected_encoding = None  # Store detected encoding to avoid re-detection
         self._last_file_size = 0  # Track last known file size
         self._truncation_callback = None  # Callback for file truncation events
+        self._decoder = None  # Incremental decoder for the current encoding
+        self._decode = None  # Decode step used when tailing, bound by _create_decoder
+        self._watch = None  # Change notifications for the open file (Linux only)
+        self._last_full_check = 0.0  # Monotonic time of the last unconditional check
+        self._last_path_check = 0.0  # Monotonic time the path was last checked for rotation
 
     def _encoding_from_bom(self, fh) -> Optional[str]:
         """
@@ -53,12 +169,8 @@ class FileManager:
         Returns:
             Detected encoding string or None if no BOM found
         """
-        pos = fh.tell()
-        try:
-            fh.seek(0)
-            head = fh.read(4)
-        finally:
-            fh.seek(pos)
+        # Positional read: the handle's offset is left untouched
+        head = _pread(fh.fileno(), 4, 0)
         if not head:
             return None
         if head.startswith(b"\xff\xfe"):
@@ -80,22 +192,40 @@ class FileManager:
             True if file opened successfully
         """
         self.close()
-        self._fh = open(self.path, "rb")
+        # Unbuffered: reads go straight to the OS without an extra
+        # BufferedReader copy, which is all the tailing loop needs
+        self._fh = open(self.path, "rb", buffering=0)
+        self._fd = self._fh.fileno()
         try:
             # Get file inode for rotation detection
-            st = os.fstat(self._fh.fileno())
+            st = os.fstat(self._fd)
             self._inode = (st.st_dev, st.st_ino)
+            self._ctime_ns = st.st_ctime_ns
         except Exception:
             self._inode = None
+            self._ctime_ns = None
 
-        # Auto-detect encoding (BOM first) - only if not already detected
-        if self.encoding == "auto" and self._detected_encoding is None:
-            enc = self._encoding_from_bom(self._fh)
-            self._detected_encoding = enc or "utf-8"
-            self.encoding = self._detected_encoding
+        # Auto-detect encoding (BOM first) - only if not already detected.
+        # A reopen after rotation keeps the encoding detected earlier: the
+        # replacement file is usually still empty, and callers may have set
+        # encoding back to "auto" since the first open
+        if self._auto_detect:
+            if self._detected_encoding is None:
+                self._detect_encoding()
+            else:
+                self.encoding = self._detected_encoding
 
-        # Always start from beginning for initial load
-        self._fh.seek(0)
+        # Resolve the codec once; reads reuse the same incremental decoder
+        self._create_decoder()
+
+        # Subscribe to change events so idle polls can skip the file entirely
+        if sys.platform.startswith("linux"):
+            try:
+                self._watch = _InotifyWatch(self.path)
+            except (OSError, AttributeError):
+                self._watch = None  # Fall back to checking the file on every poll
+
+        # Always start from beginning for initial load (a fresh handle is already there)
         self._pos = 0
         
         # Initialize file size tracking
@@ -106,21 +236,105 @@ class FileManager:
         
         return True
 
+    def _detect_encoding(self) -> bool:
+        """
+        Detect the file encoding once from its leading bytes.
+        
+        Checks for a BOM first, then applies the NUL byte heuristic to a
+        bounded prefix to recognize UTF-16 logs written without a BOM.
+        The result is cached in _detected_encoding until the encoding is
+        reset, so later reads never re-examine content.
+        
+        Returns:
+            True if an encoding was decided, False if the file is still empty
+        """
+        enc = self._encoding_from_bom(self._fh)
+        if enc is None:
+            head = _pread(self._fd, ENCODING_SNIFF_BYTES, 0)
+            if not head:
+                # Nothing to examine yet - decide when content first arrives
+                self.encoding = "utf-8"
+                return False
+            # More than 25% NULs suggests UTF-16
+            enc = "utf-16-le" if self._nul_ratio_prefix(head) > 0.25 else "utf-8"
+        self._detected_encoding = enc
+        self.encoding = enc
+        return True
+
+    def _create_decoder(self):
+        """
+        Create an incremental decoder for the current encoding.
+        
+        The decoder keeps incomplete multibyte sequences between reads so
+        characters split across read boundaries are decoded correctly.
+        Falls back to UTF-8 if the encoding is not supported.
+        """
+        try:
+            decoder_class = codecs.getincrementaldecoder(self.encoding)
+        except LookupError:
+            self._detected_encoding = "utf-8"
+            self.encoding = self._detected_encoding
+            decoder_class = codecs.getincrementaldecoder(self.encoding)
+        self._decoder = decoder_class(errors="replace")
+        
+        # Bind the tailing decode step once so read_new_text carries no
+        # encoding branches; an empty auto-detect file detects on first data
+        if self._auto_detect and self._detected_encoding is None:
+            self._decode = self._detect_then_decode
+        else:
+            self._decode = self._decoder.decode
+
+    def _detect_then_decode(self, data: bytes) -> str:
+        """
+        Detect the encoding of a file that was empty when opened, then decode.
+        
+        Args:
+            data: First bytes read from the file
+            
+        Returns:
+            Decoded text
+        """
+        if self._detect_encoding():
+            self._create_decoder()
+        else:
+            self._decode = self._decoder.decode
+        return self._decoder.decode(data)
+
     def close(self):
         """Close the file handle and reset state."""
         try:
             if self._fh:
                 self._fh.close()
+            if self._watch:
+                self._watch.close()
         finally:
             self._fh = None
+            self._fd = -1
+            self._watch = None
             self._inode = None
+            self._ctime_ns = None
             self._pos = 0
     
+    def watch_fileno(self) -> Optional[int]:
+        """
+        Get a descriptor that becomes readable when the open file changes.
+        
+        The descriptor is replaced when the file is reopened, so callers
+        should fetch it again after each read.
+        
+        Returns:
+            File descriptor, or None if change notifications are unavailable
+        """
+        return self._watch.fileno() if self._watch is not None else None
+    
     def reset_encoding(self):
         """Reset detected encoding - useful when opening a new file."""
         self._detected_encoding = None
         if self.encoding == "auto":
             self.encoding = DEFAULT_ENCODING
+        if self._decoder is not None:
+            # Don't carry a partial code point over into a different encoding
+            self._create_decoder()
     
     def force_encoding_detection(self):
         """Force re-detection of encoding from file content."""
@@ -138,37 +352,24 @@ class FileManager:
         """
         self._truncation_callback = callback
     
-    def _analyze_content_encoding(self, data: bytes) -> str:
+    def _nul_ratio_prefix(self, data: bytes, n: int = ENCODING_SNIFF_BYTES) -> float:
         """
-        Analyze content to determine the most likely encoding.
+        Calculate the ratio of NUL bytes in the first n bytes of data.
+        
+        NUL density is uniform across UTF-16 text, so a bounded prefix is
+        enough to classify the encoding without scanning the whole buffer.
         
         Args:
             data: Raw bytes to analyze
+            n: Maximum number of leading bytes to examine
             
         Returns:
-            Suggested encoding string
+            Fraction of NUL bytes in the examined prefix (0.0 for empty data)
         """
-        if not data:
-            return self.encoding
-            
-        # Check for BOM first
-        if data.startswith(b"\xff\xfe"):
-            return "utf-16-le"
-        if data.startswith(b"\xfe\xff"):
-            return "utf-16-be"
-        if data.startswith(b"\xef\xbb\xbf"):
-            return "utf-8-sig"
-            
-        # Heuristic: analyze NUL byte patterns
-        nul_ratio = data.count(b"\x00") / len(data) if data else 0
-        
-        if nul_ratio > 0.25:  # More than 25% NULs suggests UTF-16
-            return "utf-16-le"
-        elif nul_ratio < 0.05:  # Less than 5% NULs suggests UTF-8
-            return "utf-8"
-        else:
-            # Middle ground - keep current encoding
-            return self.encoding
+        sample = data[:n]
+        if not sample:
+            return 0.0
+        return sample.count(b"\x00") / len(sample)
     
     def _detect_mixed_encoding(self, data: bytes) -> bool:
         """
@@ -183,67 +384,85 @@ class FileManager:
         if not data or len(data) < 10:
             return False
             
-        # Check for mixed patterns that suggest encoding issues
-        # Look for sequences that are neither valid UTF-8 nor UTF-16
+        # Content is mixed only if it is neither valid UTF-8 nor valid UTF-16.
+        # Each check short-circuits, so most data never needs a trial decode.
+        
+        # Pure ASCII is valid UTF-8 - checked in C without allocating a string
+        if data.isascii():
+            return False
         
-        # Count valid UTF-8 sequences vs invalid ones
         try:
             data.decode('utf-8')
-            utf8_valid = True
+            return False
         except UnicodeDecodeError:
-            utf8_valid = False
-            
-        # Count valid UTF-16 sequences vs invalid ones  
+            pass
+        
+        # UTF-16 needs whole code units; an odd length can never be valid
+        if len(data) % 2:
+            return True
+        
         try:
             data.decode('utf-16-le')
-            utf16_valid = True
+            return False
         except UnicodeDecodeError:
-            utf16_valid = False
-            
-        # If neither encoding is valid, we likely have mixed content
-        return not (utf8_valid or utf16_valid)
+            return True
 
-    def _check_rotation_or_truncate(self):
+    def _check_rotation_or_truncate(self) -> Optional[int]:
         """
         Check for file rotation or truncation and reopen if needed.
         
         Detects when the file has been rotated (new inode) or truncated
         (file size smaller than last position) and handles accordingly.
+        The open descriptor is checked on every call; the path is only
+        re-stat'ed when the file shrank, when inotify reported it moved,
+        deleted or replaced, or every ROTATION_CHECK_SECONDS, since a
+        rotated file stays readable through the old descriptor.
+        
+        Returns:
+            Current size of the open file, or None if it cannot be determined
         """
         try:
-            st_path = os.stat(self.path)
-            inode = (st_path.st_dev, st_path.st_ino)
-            current_size = st_path.st_size
+            st = os.fstat(self._fd)
         except OSError:
-            return  # Possibly temporarily missing during rotation
-            
-        if self._inode and inode != self._inode:
-            # File rotated/recreated - reopen from beginning
-            self.open(start_at_end=False)
-            self._last_file_size = current_size
-            return
-            
-        if self._fh:
+            return None
+        current_size = st.st_size
+        
+        now = time.monotonic()
+        if current_size < self._pos or now - self._last_path_check >= ROTATION_CHECK_SECONDS:
+            self._last_path_check = now
             try:
-                size = os.fstat(self._fh.fileno()).st_size
-                if size < self._pos:
-                    # File truncated - reset to beginning
-                    self._fh.seek(0)
-                    self._pos = 0
-                    
-                    # Check if file size has significantly decreased (more than 50% reduction)
-                    if (self._last_file_size > 0 and 
-                        current_size < self._last_file_size * 0.5 and 
-                        self._truncation_callback):
-                        # Call the truncation callback to notify main window
-                        self._truncation_callback()
-                    
-                    self._last_file_size = current_size
+                st_path = os.stat(self.path)
+                if self._inode and (st_path.st_dev, st_path.st_ino) != self._inode:
+                    # File rotated/recreated - reopen from beginning
+                    self.open(start_at_end=False)
+                    self._last_file_size = st_path.st_size
+                    return st_path.st_size
             except OSError:
-                pass
+                pass  # Possibly temporarily missing during rotation
+        
+        # Nothing to reconcile when neither the size nor ctime moved since the
+        # last check. ctime alone is not enough: on Windows it is the creation
+        # time and never changes, so a truncation must still be caught by size
+        if current_size == self._last_file_size and st.st_ctime_ns == self._ctime_ns:
+            return current_size
+        self._ctime_ns = st.st_ctime_ns
+        
+        if current_size < self._pos:
+            # File truncated - reset to beginning
+            self._fh.seek(0)
+            self._pos = 0
+            self._decoder.reset()
+            
+            # Check if file size has significantly decreased (more than 50% reduction)
+            if (self._last_file_size > 0 and 
+                current_size < self._last_file_size * 0.5 and 
+                self._truncation_callback):
+                # Call the truncation callback to notify main window
+                self._truncation_callback()
         
         # Update last known file size
         self._last_file_size = current_size
+        return current_size
 
     def read_entire_file(self, chunk_size: int = 1024 * 1024, progress_callback=None) -> str:
         """
@@ -268,13 +487,38 @@ class FileManager:
         except OSError:
             file_size = 0
 
+        # The file was empty when opened - detect now that content exists
+        if file_size and self._auto_detect and self._detected_encoding is None:
+            if self._detect_encoding():
+                self._create_decoder()
+
         self._fh.seek(0)
+        self._decoder.reset()
         content = []
         total_read = 0
+        next_report = PROGRESS_REPORT_BYTES
+        total_text = format_size(file_size)
         
         if progress_callback:
             progress_callback(0, "")
         
+        # Let the kernel read ahead aggressively for the sequential scan
+        self._advise("POSIX_FADV_SEQUENTIAL")
+        
+        # Very large files bypass the page cache entirely where supported
+        if file_size >= DIRECT_READ_THRESHOLD:
+            decoded_content = self._read_direct(chunk_size, progress_callback)
+            if decoded_content is not None:
+                return decoded_content
+        
+        # Large files are decoded straight from a memory map
+        if file_size >= MMAP_READ_THRESHOLD:
+            decoded_content = self._read_mapped(chunk_size, progress_callback)
+            if decoded_content is not None:
+                # The decoded text is all we keep; release the cached pages
+                self._advise("POSIX_FADV_DONTNEED")
+                return decoded_content
+        
         while True:
             chunk = self._fh.read(chunk_size)
             if not chunk:
@@ -282,70 +526,154 @@ class FileManager:
             content.append(chunk)
             total_read += len(chunk)
             
-            # Update progress if callback provided
-            if progress_callback and file_size > 0:
+            # Update progress if callback provided, at most once per report interval
+            if progress_callback and file_size > 0 and (total_read >= next_report or total_read >= file_size):
+                next_report = total_read + PROGRESS_REPORT_BYTES
                 progress = (total_read / file_size) * 100.0
-                progress_callback(progress, f"{self._format_size(total_read)} / {self._format_size(file_size)}")
-                
+                progress_callback(progress, f"{format_size(total_read)} / {total_text}")
         
         if progress_callback:
             progress_callback(80, "")
         
         # Combine all chunks
         data = b''.join(content)
-        
-        # Heuristic: if we don't have a BOM and see lots of NULs, switch to utf-16-le
-        # Only apply this heuristic once per file to avoid changing encoding mid-stream
-        if (self.encoding in ("utf-8", "utf-8-sig") and 
-            self._detected_encoding is None and 
-            data and data.count(b"\x00") > len(data) // 4):
-            self._detected_encoding = "utf-16-le"
-            self.encoding = self._detected_encoding
 
         if progress_callback:
             progress_callback(90, "")
 
+        # Not final: an incomplete trailing character completes on the next read
+        decoded_content = self._decoder.decode(data)
+        
+        # IMPORTANT: Set position to end for future tailing AFTER reading
+        # This ensures we start monitoring from the current end of file
+        self._pos = total_read
+        
+        if progress_callback:
+            progress_callback(99, "                                              ")
+            progress_callback(100, "Reading!")
+        
+        return decoded_content
+    
+    def _advise(self, advice: str):
+        """
+        Pass an access pattern hint for the open file to the kernel.
+        
+        No-op where posix_fadvise is unavailable (Windows, macOS).
+        
+        Args:
+            advice: Name of the os.POSIX_FADV_* constant to apply to the whole file
+        """
+        if not hasattr(os, "posix_fadvise"):
+            return
         try:
-            decoded_content = data.decode(self.encoding, errors="replace")
-            
-            # IMPORTANT: Set position to end for future tailing AFTER reading
-            # This ensures we start monitoring from the current end of file
-            self._pos = self._fh.tell()
-            
-            if progress_callback:
-                progress_callback(99, "                                              ")
-                progress_callback(100, "Reading!")
-            
-            return decoded_content
-        except LookupError:
-            # Fallback to UTF-8 if encoding not supported
-            if self._detected_encoding is None:
-                self._detected_encoding = "utf-8"
-                self.encoding = self._detected_encoding
-            decoded_content = data.decode("utf-8", errors="replace")
-            
-            # Set position to end for future tailing
-            self._pos = self._fh.tell()
+            os.posix_fadvise(self._fh.fileno(), 0, 0, getattr(os, advice))
+        except OSError:
+            pass
+
+    def _read_direct(self, chunk_size: int, progress_callback=None) -> Optional[str]:
+        """
+        Read and decode the entire file with O_DIRECT into one aligned buffer.
+        
+        Each block is read from the device straight into a page-aligned
+        anonymous map and decoded from there, so a multi-GB initial load
+        neither passes through nor evicts the page cache.
+        
+        Args:
+            chunk_size: Number of bytes read per step (must be page aligned)
+            progress_callback: Optional callback function(progress, message) for progress updates
             
-            if progress_callback:
-                progress_callback(100, "File read complete (UTF-8 fallback)")
+        Returns:
+            Entire file content as string, or None if direct I/O is unavailable
+        """
+        if not hasattr(os, "O_DIRECT") or chunk_size % mmap.PAGESIZE:
+            return None
+        try:
+            fd = os.open(self.path, os.O_RDONLY | os.O_DIRECT)
+        except OSError:
+            return None
+
+        buffer = mmap.mmap(-1, chunk_size)  # Anonymous maps are page aligned
+        view = memoryview(buffer)
+        content = []
+        total_read = 0
+        try:
+            file_size = os.fstat(fd).st_size
+            next_report = PROGRESS_REPORT_BYTES
+            total_text = format_size(file_size)
+            while True:
+                n = os.readv(fd, [buffer])
+                if not n:
+                    break
+                # Not final: an incomplete trailing character completes on the next read
+                content.append(self._decoder.decode(view[:n]))
+                total_read += n
+                
+                if progress_callback and file_size > 0 and (total_read >= next_report or total_read >= file_size):
+                    next_report = total_read + PROGRESS_REPORT_BYTES
+                    progress = min(total_read / file_size, 1.0) * 100.0
+                    progress_callback(progress, f"{format_size(total_read)} / {total_text}")
+        except OSError:
+            # Filesystem rejected direct I/O (EINVAL) - let the caller fall back
+            self._decoder.reset()
+            return None
+        finally:
+            view.release()
+            buffer.close()
+            os.close(fd)
+
+        # Continue tailing from the end of what was read
+        self._pos = total_read
+        
+        if progress_callback:
+            progress_callback(100, "Reading!")
+        
+        return ''.join(content)
+
+    def _read_mapped(self, chunk_size: int, progress_callback=None) -> Optional[str]:
+        """
+        Read and decode the entire file through a read-only memory map.
+        
+        Decodes directly from the page cache chunk by chunk, avoiding the
+        list of chunk copies and the joined bytes object that the buffered
+        path builds, which roughly halves peak memory for very large logs.
+        
+        Args:
+            chunk_size: Number of bytes decoded per step
+            progress_callback: Optional callback function(progress, message) for progress updates
             
-            return decoded_content
-    
-    def _format_size(self, size_bytes: int) -> str:
-        """Format file size in human-readable format."""
+        Returns:
+            Entire file content as string, or None if the file cannot be mapped
+        """
         try:
-            if size_bytes < 1024:
-                return f"{size_bytes} B"
-            elif size_bytes < 1024 * 1024:
-                return f"{size_bytes / 1024:.1f} KB"
-            elif size_bytes < 1024 * 1024 * 1024:
-                return f"{size_bytes / (1024 * 1024):.1f} MB"
-            else:
-                return f"{size_bytes / (1024 * 1024 * 1024):.1f} GB"
-        except Exception:
-            return f"{size_bytes} bytes"
+            mapped = mmap.mmap(self._fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+
+        content = []
+        try:
+            mapped_size = len(mapped)
+            next_report = PROGRESS_REPORT_BYTES
+            total_text = format_size(mapped_size)
+            for offset in range(0, mapped_size, chunk_size):
+                # Not final: an incomplete trailing character completes on the next read
+                content.append(self._decoder.decode(mapped[offset:offset + chunk_size]))
+                
+                done = min(offset + chunk_size, mapped_size)
+                if progress_callback and (done >= next_report or done == mapped_size):
+                    next_report = done + PROGRESS_REPORT_BYTES
+                    progress = (done / mapped_size) * 100.0
+                    progress_callback(progress, f"{format_size(done)} / {total_text}")
+        finally:
+            mapped.close()
 
+        # Continue tailing from the end of what was mapped
+        self._pos = mapped_size
+        
+        if progress_callback:
+            progress_callback(100, "Reading!")
+        
+        return ''.join(content)
+    
     def read_new_text(self) -> str:
         """
         Read new text from the file since last read.
@@ -362,43 +690,28 @@ class FileManager:
             except OSError:
                 return ""
 
-        self._check_rotation_or_truncate()
-        
-        # Get current file size to check if there's new content
-        try:
-            current_size = os.path.getsize(self.path)
-            if current_size <= self._pos:
-                # No new content since last read
-                return ""
-        except OSError:
+        # Without change events there is nothing new; still re-check now and
+        # then in case events were dropped or the file was replaced unseen
+        if self._watch is not None:
+            events = self._watch.read_events()
+            if not events:
+                now = time.monotonic()
+                if now - self._last_full_check < FILE_WATCH_FALLBACK_SECONDS:
+                    return ""
+                self._last_full_check = now
+            elif events & _InotifyWatch.PATH_MASK:
+                # The file may have been moved, deleted or replaced: check
+                # the path now rather than at the next periodic check
+                self._last_path_check = 0.0
+
+        current_size = self._check_rotation_or_truncate()
+        if current_size is None or current_size <= self._pos:
+            # No new content since last read
             return ""
         
-        # Seek to our last position and read new content
-        self._fh.seek(self._pos)
-        data = self._fh.read()
-        if not data:
-            return ""
-
-        # Update position to current end of file
-        self._pos = self._fh.tell()
-
-        # Continuous encoding detection for new content
-        # This helps catch cases where new content has different encoding characteristics
-        if data:
-            suggested_encoding = self._analyze_content_encoding(data)
-            if suggested_encoding != self.encoding:
-                print(f"Debug: Encoding changed from {self.encoding} to {suggested_encoding} for new content")
-                self._detected_encoding = suggested_encoding
-                self.encoding = suggested_encoding
-
-        try:
-            return data.decode(self.encoding, errors="replace")
-        except LookupError:
-            # Fallback to UTF-8 if encoding not supported
-            if self._detected_encoding != "utf-8":
-                self._detected_encoding = "utf-8"
-                self.encoding = self._detected_encoding
-                print(f"Debug: Fallback to UTF-8 encoding for new content")
-            return data.decode("utf-8", errors="replace")
+        # Read exactly the new bytes at our position in one syscall
+        data = _pread(self._fd, current_size - self._pos, self._pos)
+        self._pos += len(data)
+        return self._decode(data)
     
 
@@ -9,8 +9,33 @@ comprehensive error handling for invalid patterns.
 """
 
 import re
-from typing import Dict, Any, List
-from src.utils.constants import DEFAULT_FILTER_MODE, MAX_FILTER_HISTORY
+import queue
+from typing import Callable, Dict, Any, List, Optional, Sequence, Tuple
+from src.utils.constants import (
+    DEFAULT_FILTER_MODE, MAX_FILTER_HISTORY, FILTER_HISTORY_LABEL_CHARS, FILTER_CHUNK_LINES
+)
+
+# Characters that give a regex pattern meaning beyond literal text
+_REGEX_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+
+# ASCII letters that some non-ASCII character case-folds to (or from) in a
+# way re.IGNORECASE does not reproduce, e.g. "ß" -> "ss", "İ" -> "i̇" and
+# the "ﬀ"/"ﬂ" ligatures; found by checking every code point against
+# str.casefold()
+_FOLD_UNSAFE_ASCII = frozenset("afhijlnstwy")
+
+# Regex filters that match every line, so no line needs to be searched
+_MATCH_ALL_PATTERNS = frozenset({"^", "$", ".*", ".*?", "^.*", ".*$", "^.*$"})
+
+
+def _always_true(line: str) -> bool:
+    """Matcher for filters that accept every line."""
+    return True
+
+
+def _never_true(line: str) -> bool:
+    """Matcher for filters that accept no line (invalid regex)."""
+    return False
 
 
 class FilterManager:
@@ -35,12 +60,16 @@ class FilterManager:
     def __init__(self):
         """Initialize filter manager with default settings."""
         self.current_filter = ""          # Current filter text
+        self._filter_cf = ""              # Case-folded filter text for case-insensitive modes
         self.current_mode = DEFAULT_FILTER_MODE    # Current filter mode
         self.case_sensitive = False       # Case sensitivity flag
-        self.filter_history = []          # List of previous filters
+        self.filter_history = {}          # Previous filters, oldest first, mapped to their menu labels
         self.max_history = MAX_FILTER_HISTORY            # Maximum history items to keep
         self.compiled_regex = None        # Compiled regex pattern (if applicable)
+        self._literals = ()               # Alternatives of a literal-only regex like "ERROR|WARN"
+        self._prefix_regex = None         # Anchored pattern for case-insensitive starts_with
         self.last_error = None            # Last regex compilation error
+        self._match_fn = self._contains_match  # Matcher for the current mode
         
     def set_filter(self, text: str, mode: str = None, case_sensitive: bool = None) -> bool:
         """
@@ -54,40 +83,96 @@ class FilterManager:
         Returns:
             True if filter changed, False if no change
         """
-        if mode is not None:
+        changed = False
+        if mode is not None and mode != self.current_mode:
             self.current_mode = mode
-        if case_sensitive is not None:
+            changed = True
+        if case_sensitive is not None and case_sensitive != self.case_sensitive:
             self.case_sensitive = case_sensitive
+            changed = True
             
         if text != self.current_filter:
             self.current_filter = text
+            self._filter_cf = text.casefold() if text else ""
             self._add_to_history(text)
+            changed = True
+        
+        if changed:
             self._compile_regex()
-            return True
-        return False
+        return changed
     
     def _add_to_history(self, text: str):
         """
-        Add filter text to history if it's not empty and not already there.
+        Add filter text to history as the most recent entry.
+        
+        An insertion-ordered dict gives O(1) membership and removal; text
+        already in the history is moved to the most recent position. The
+        shortened menu label is stored as the value so the history menu
+        does not recompute it each time it is shown.
         
         Args:
             text: Filter text to add to history
         """
-        if text and text not in self.filter_history:
-            self.filter_history.insert(0, text)
-            # Maintain maximum history size
+        if text:
+            label = self.filter_history.pop(text, None)
+            if label is None:
+                label = text[:FILTER_HISTORY_LABEL_CHARS]
+                if label != text:
+                    label += "..."
+            self.filter_history[text] = label
+            # Maintain maximum history size by dropping the oldest entry
             if len(self.filter_history) > self.max_history:
-                self.filter_history.pop()
+                del self.filter_history[next(iter(self.filter_history))]
+    
+    def get_filter_history(self) -> List[str]:
+        """
+        Get previous filters for display.
+        
+        Returns:
+            List of filter texts, most recent first
+        """
+        return list(reversed(self.filter_history))
+    
+    def get_filter_history_items(self) -> List[Tuple[str, str]]:
+        """
+        Get previous filters with their menu labels.
+        
+        Returns:
+            List of (filter text, display text) pairs, most recent first
+        """
+        return list(reversed(self.filter_history.items()))
     
     def _compile_regex(self):
         """
-        Compile regex pattern if mode is regex.
+        Compile regex pattern if mode is regex and select the mode's matcher.
         
         Handles regex compilation errors gracefully and stores error messages
-        for user feedback.
+        for user feedback. The matcher is chosen here, once per filter change,
+        so matches() does not re-dispatch on the mode for every line.
         """
         self.compiled_regex = None
         self.last_error = None
+        self._match_fn = {
+            "contains": self._contains_match,
+            "starts_with": self._starts_with_match,
+            "ends_with": self._ends_with_match,
+            "regex": self._regex_match,
+            "exact": self._exact_match,
+            "not_contains": self._not_contains_match,
+        }.get(self.current_mode, self._contains_match)
+        
+        self._literals = ()
+        self._prefix_regex = None
+        
+        # Case-insensitive starts_with: an anchored IGNORECASE match stops
+        # after the prefix without folding any of the line. It only agrees
+        # with the casefold comparison for ASCII filters that avoid the
+        # letters in _FOLD_UNSAFE_ASCII; other filters keep the casefold path.
+        if (self.current_mode == "starts_with" and not self.case_sensitive
+                and self.current_filter.isascii()
+                and _FOLD_UNSAFE_ASCII.isdisjoint(self._filter_cf)):
+            self._prefix_regex = re.compile(re.escape(self.current_filter), re.IGNORECASE)
+            self._match_fn = self._prefix_regex_match
         
         if self.current_mode == "regex" and self.current_filter:
             try:
@@ -95,6 +180,56 @@ class FilterManager:
                 self.compiled_regex = re.compile(self.current_filter, flags)
             except re.error as e:
                 self.last_error = str(e)
+                return
+            
+            if self.current_filter in _MATCH_ALL_PATTERNS:
+                self._match_fn = _always_true
+                return
+            
+            # A plain alternation of literals is faster as substring tests
+            # than through the backtracking engine. Ignoring case, only ASCII
+            # literals are tested this way: lower() agrees with re.IGNORECASE
+            # on ASCII text, while casefold() does not ("ß" -> "ss")
+            alternatives = self.current_filter.split("|")
+            if all(alternatives) and not any(
+                _REGEX_METACHARACTERS.intersection(alt) for alt in alternatives
+            ) and (self.case_sensitive or self.current_filter.isascii()):
+                if self.case_sensitive:
+                    self._literals = tuple(alternatives)
+                else:
+                    self._literals = tuple(alt.lower() for alt in alternatives)
+                self._match_fn = self._literal_alternation_match
+    
+    def is_refinement_of(self, text: str, mode: str, case_sensitive: bool) -> bool:
+        """
+        Check whether the current filter only narrows a previous filter.
+        
+        True when every line the current filter matches was also matched by
+        the previous one: same mode and case sensitivity, with the filter
+        text extended in a way the mode preserves - any longer text that
+        contains it for contains, text added at the end for starts_with and
+        at the start for ends_with. Regex, exact and not_contains filters
+        are never treated as refinements.
+        
+        Args:
+            text: Previous filter text
+            mode: Previous filter mode
+            case_sensitive: Previous case sensitivity flag
+            
+        Returns:
+            True if the current filter matches a subset of the previous one
+        """
+        if (not text or self.last_error or mode != self.current_mode
+                or case_sensitive != self.case_sensitive):
+            return False
+        current = self.current_filter
+        if mode == "contains":
+            return text in current
+        if mode == "starts_with":
+            return current.startswith(text)
+        if mode == "ends_with":
+            return current.endswith(text)
+        return False
     
     def matches(self, line: str) -> bool:
         """
@@ -113,24 +248,150 @@ class FilterManager:
             return False
             
         try:
-            # Route to appropriate matching method based on mode
-            if self.current_mode == "contains":
-                return self._contains_match(line)
-            elif self.current_mode == "starts_with":
-                return self._starts_with_match(line)
-            elif self.current_mode == "ends_with":
-                return self._ends_with_match(line)
-            elif self.current_mode == "regex":
-                return self._regex_match(line)
-            elif self.current_mode == "exact":
-                return self._exact_match(line)
-            elif self.current_mode == "not_contains":
-                return self._not_contains_match(line)
-            else:
-                return self._contains_match(line)
+            return self._match_fn(line)
         except Exception:
             return False
     
+    def snapshot(self) -> "FilterManager":
+        """
+        Get a detached copy of the current filter for use on another thread.
+        
+        The matchers read the manager's state on every call, and set_filter
+        changes that state on the UI thread. A worker that filters through
+        the copy keeps applying the filter it started with, instead of
+        mixing old and new settings between chunks. The copy has no history.
+        
+        Returns:
+            New FilterManager with the same filter text, mode and case sensitivity
+        """
+        copy = FilterManager()
+        copy.current_filter = self.current_filter
+        copy._filter_cf = self._filter_cf
+        copy.current_mode = self.current_mode
+        copy.case_sensitive = self.case_sensitive
+        copy._compile_regex()
+        return copy
+    
+    def fast_predicate(self) -> Callable[[str], Any]:
+        """
+        Get the cheapest callable that tests one line against the filter.
+        
+        Regex filters return the compiled pattern's bound search (or match,
+        for the anchored starts_with pattern) so callers skip the matcher
+        method; other modes return the matcher selected when the filter
+        was set. Unlike matches(), the callable does not catch exceptions
+        and returns a truthy value rather than a bool.
+        
+        Returns:
+            Callable taking a line and returning a truthy value on a match
+        """
+        if not self.current_filter:
+            return _always_true
+        if self.last_error:
+            return _never_true
+        if self._match_fn == self._regex_match:
+            return self.compiled_regex.search
+        if self._match_fn == self._prefix_regex_match:
+            return self._prefix_regex.match
+        return self._match_fn
+    
+    def filter_lines(self, lines: Sequence[str], numbered: bool = False, start: int = 1) -> list:
+        """
+        Filter a batch of lines in a single pass.
+        
+        Equivalent to calling matches() on each line, but resolves the
+        matcher once and runs it in one comprehension. contains,
+        not_contains and regex mode test the line inline, without a
+        Python-level method call per line.
+        
+        Args:
+            lines: Text lines to filter
+            numbered: If True, return (line_number, line) pairs
+            start: Line number of the first line when numbered
+            
+        Returns:
+            Matching lines, or (line_number, line) pairs if numbered
+        """
+        if not self.current_filter:
+            return list(enumerate(lines, start)) if numbered else list(lines)
+        if self.last_error:
+            return []
+        if self._match_fn is _always_true:
+            return list(enumerate(lines, start)) if numbered else list(lines)
+        
+        try:
+            if self.current_mode == "contains" and self.case_sensitive:
+                needle = self.current_filter
+                if numbered:
+                    return [(i, line) for i, line in enumerate(lines, start) if needle in line]
+                return [line for line in lines if needle in line]
+            if self.current_mode == "contains":
+                needle = self._filter_cf
+                if numbered:
+                    return [(i, line) for i, line in enumerate(lines, start) if needle in line.casefold()]
+                return [line for line in lines if needle in line.casefold()]
+            if self.current_mode == "not_contains" and self.case_sensitive:
+                needle = self.current_filter
+                if numbered:
+                    return [(i, line) for i, line in enumerate(lines, start) if needle not in line]
+                return [line for line in lines if needle not in line]
+            if self.current_mode == "not_contains":
+                needle = self._filter_cf
+                if numbered:
+                    return [(i, line) for i, line in enumerate(lines, start) if needle not in line.casefold()]
+                return [line for line in lines if needle not in line.casefold()]
+            
+            match = self.fast_predicate()
+            if numbered:
+                return [(i, line) for i, line in enumerate(lines, start) if match(line)]
+            return [line for line in lines if match(line)]
+        except Exception:
+            # Same semantics as matches(): a line that fails to match is skipped
+            if numbered:
+                return [(i, line) for i, line in enumerate(lines, start) if self.matches(line)]
+            return [line for line in lines if self.matches(line)]
+    
+    def filter_stream(self, lines: Sequence[str], out_queue: queue.Queue, stop_event=None,
+                      chunk_size: int = FILTER_CHUNK_LINES, numbered: bool = False,
+                      count: Optional[int] = None):
+        """
+        Filter lines chunk by chunk, publishing each chunk's matches to a queue.
+        
+        Meant to run on a worker thread so a large rebuild never blocks the
+        Tk main loop; the UI drains out_queue from an after() callback. Call
+        it on a snapshot() taken on the UI thread, so a concurrent
+        set_filter cannot change the filter partway through. Each
+        item put on the queue is the filter_lines() result for one chunk,
+        and None marks the end of the stream. A bounded queue applies back
+        pressure; setting stop_event abandons the stream without the final
+        None.
+        
+        Args:
+            lines: Lines to filter; may be appended to while streaming
+            out_queue: Queue receiving per-chunk results
+            stop_event: Optional threading.Event that cancels the stream
+            chunk_size: Number of lines filtered per chunk
+            numbered: If True, chunks hold (line_number, line) pairs numbered from 1
+            count: Number of leading lines to filter (default: len(lines) at the start)
+        """
+        def publish(item) -> bool:
+            while True:
+                if stop_event is not None and stop_event.is_set():
+                    return False
+                try:
+                    out_queue.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+        
+        if count is None:
+            count = len(lines)
+        for offset in range(0, count, chunk_size):
+            chunk = self.filter_lines(lines[offset:min(offset + chunk_size, count)], numbered, offset + 1)
+            if not publish(chunk):
+                return
+        publish(None)
+    
     def _contains_match(self, line: str) -> bool:
         """
         Check if line contains the filter text.
@@ -143,7 +404,7 @@ class FilterManager:
         """
         if self.case_sensitive:
             return self.current_filter in line
-        return self.current_filter.lower() in line.lower()
+        return self._filter_cf in line.casefold()
     
     def _starts_with_match(self, line: str) -> bool:
         """
@@ -157,7 +418,21 @@ class FilterManager:
         """
         if self.case_sensitive:
             return line.startswith(self.current_filter)
-        return line.lower().startswith(self.current_filter.lower())
+        # Fold only the prefix that can match instead of the whole line; folding
+        # never shortens text, so this many characters always cover the filter
+        return line[:len(self._filter_cf)].casefold().startswith(self._filter_cf)
+    
+    def _prefix_regex_match(self, line: str) -> bool:
+        """
+        Check if line starts with the filter text, ignoring case (fold-safe ASCII filters).
+        
+        Args:
+            line: Text line to check
+            
+        Returns:
+            True if line begins with filter text
+        """
+        return self._prefix_regex.match(line) is not None
     
     def _ends_with_match(self, line: str) -> bool:
         """
@@ -171,7 +446,9 @@ class FilterManager:
         """
         if self.case_sensitive:
             return line.endswith(self.current_filter)
-        return line.lower().endswith(self.current_filter.lower())
+        # Fold only the suffix that can match instead of the whole line; folding
+        # never shortens text, so this many characters always cover the filter
+        return line[-len(self._filter_cf):].casefold().endswith(self._filter_cf)
     
     def _regex_match(self, line: str) -> bool:
         """
@@ -187,6 +464,27 @@ class FilterManager:
             return bool(self.compiled_regex.search(line))
         return False
     
+    def _literal_alternation_match(self, line: str) -> bool:
+        """
+        Check if line contains any alternative of a literal-only regex.
+        
+        Args:
+            line: Text line to check
+            
+        Returns:
+            True if any alternative is found in line
+        """
+        if not self.case_sensitive:
+            # Non-ASCII lines go through the regex, which decides case
+            # equivalence for characters outside ASCII
+            if not line.isascii():
+                return self.compiled_regex.search(line) is not None
+            line = line.lower()
+        for literal in self._literals:
+            if literal in line:
+                return True
+        return False
+    
     def _exact_match(self, line: str) -> bool:
         """
         Check if line exactly matches the filter text.
@@ -199,7 +497,7 @@ class FilterManager:
         """
         if self.case_sensitive:
             return line == self.current_filter
-        return line.lower() == self.current_filter.lower()
+        return line.casefold() == self._filter_cf
     
     def _not_contains_match(self, line: str) -> bool:
         """
@@ -211,7 +509,10 @@ class FilterManager:
         Returns:
             True if line does NOT contain filter text
         """
-        return not self._contains_match(line)
+        # Tested inline rather than through _contains_match to save a call per line
+        if self.case_sensitive:
+            return self.current_filter not in line
+        return self._filter_cf not in line.casefold()
     
     def get_filter_info(self) -> Dict[str, Any]:
         """
@@ -251,5 +552,6 @@ class FilterManager:
     def clear_filter(self):
         """Clear the current filter and reset related state."""
         self.current_filter = ""
+        self._filter_cf = ""
         self.compiled_regex = None
         self.last_error = None
@@ -11,6 +11,8 @@ from tkinter import ttk
 import threading
 import time
 
+from src.utils.formatting import format_size
+
 
 class LoadingDialog(tk.Toplevel):
     """
@@ -18,6 +20,10 @@ class LoadingDialog(tk.Toplevel):
     
     Shows a modal dialog that displays loading progress and can be
     updated from background threads to show file loading status.
+    Updates made off the UI thread are parked in single-value slots and
+    applied by a poller running on the Tk main loop while the posting
+    thread is registered with watch_thread(), since Tk must only be
+    touched from the thread that created it.
     """
     
     def __init__(self, parent, title="Loading", message="Please wait..."):
@@ -44,8 +50,25 @@ class LoadingDialog(tk.Toplevel):
         # Initialize variables
         self._progress = tk.DoubleVar(value=0.0)
         self._message = tk.StringVar(value=message)
-        self._is_cancelled = False
-        self._cancelled_event = threading.Event()
+        self._cancelled = threading.Event()
+        
+        # Latest update of each kind from other threads, waiting for the UI
+        # thread. Only the newest value matters, so writers overwrite and
+        # the poller takes each slot with dict.pop(), which is atomic.
+        self._ui_thread = threading.current_thread()
+        self._latest = {}
+        self._producers = []  # Threads registered with watch_thread() that may post updates
+        
+        # Latest progress waiting to be painted (coalesced to ~20 Hz)
+        self._pending_progress = None
+        self._pending_message = None
+        # Pending after() callbacks, cancelled when the dialog closes
+        self._flush_after_id = None
+        self._idle_after_id = None
+        self._pump_after_id = None
+        self._last_flush = 0.0
+        self._last_pct = 0
+        self._last_pct_int = -1
         
         # Build the UI
         self._build_ui()
@@ -86,9 +109,6 @@ class LoadingDialog(tk.Toplevel):
                                        command=self._cancel_loading)
         self.cancel_button.pack()
         
-        # Update progress label when progress changes
-        self._progress.trace_add('write', self._update_progress_label)
-        
     def _center_on_parent(self, parent):
         """Center the dialog on its parent window."""
         try:
@@ -108,18 +128,9 @@ class LoadingDialog(tk.Toplevel):
             # Fallback to screen center - just use default position
             pass
     
-    def _update_progress_label(self, *args):
-        """Update the progress percentage label."""
-        try:
-            progress = int(self._progress.get())
-            self.progress_label.config(text=f"{progress}%")
-        except Exception:
-            pass
-    
     def _cancel_loading(self):
         """Cancel the loading operation."""
-        self._is_cancelled = True
-        self._cancelled_event.set()
+        self._cancelled.set()
         self._message.set("Cancelling...")
         self.cancel_button.config(state=tk.DISABLED)
     
@@ -127,28 +138,128 @@ class LoadingDialog(tk.Toplevel):
         """Handle dialog closing - treat as cancel."""
         self._cancel_loading()
     
+    def _on_ui_thread(self) -> bool:
+        """Check whether the caller is the thread that owns the dialog."""
+        return threading.current_thread() is self._ui_thread
+    
+    def watch_thread(self, thread: threading.Thread):
+        """
+        Apply updates posted by a background thread while it runs.
+        
+        Must be called from the UI thread. The dialog only polls for
+        cross-thread updates while a watched thread is alive, and once
+        more after the last one ends, instead of for its whole lifetime.
+        
+        Args:
+            thread: Thread that will call the update methods
+        """
+        self._producers.append(thread)
+        if self._pump_after_id is None:
+            self._pump_after_id = self.after(50, self._pump)
+    
+    def _pump(self):
+        """
+        Apply updates posted by background threads.
+        
+        Takes the latest value of each kind, if any, then reschedules itself
+        while a watched thread is still running.
+        """
+        self._pump_after_id = None
+        # Check liveness before draining, so updates a thread posted just
+        # before finishing are still applied by this pass
+        self._producers = [thread for thread in self._producers if thread.is_alive()]
+        latest = self._latest
+        progress = latest.pop("progress", None)
+        if progress is not None:
+            self.update_progress(*progress)
+        message = latest.pop("message", None)
+        if message is not None:
+            self.update_message(message)
+        mode = latest.pop("mode", None)
+        if mode is not None:
+            self.set_progress_mode(mode)
+        
+        if not self._producers:
+            return
+        try:
+            self._pump_after_id = self.after(50, self._pump)
+        except tk.TclError:
+            pass  # Dialog already destroyed
+    
     def update_progress(self, progress: float, message: str = None):
         """
         Update the progress bar and optionally the message.
         
+        Safe to call from any thread registered with watch_thread().
+        
         Args:
             progress: Progress value (0.0 to 100.0)
             message: Optional status message to update
         """
+        if not self._on_ui_thread():
+            self._latest["progress"] = (progress, message)
+            return
+        
+        # Ensure progress is within bounds
+        if progress < 0.0:
+            progress = 0.0
+        elif progress > 100.0:
+            progress = 100.0
+        
+        # Sub-percent changes without a new message are not worth painting
+        pct = int(progress)
+        if pct == self._last_pct_int and not message:
+            return
+        self._last_pct_int = pct
+        
+        self._pending_progress = progress
+        if message:
+            self._pending_message = message
+        
+        # Paint at most once per 50ms; the final value always paints. Once
+        # the interval has elapsed the write is deferred to the next idle
+        # pass, which a caller holding the main loop reaches through
+        # update_idletasks(). A timer picks up the last value of a burst.
         try:
-            # Ensure progress is within bounds
-            progress = max(0.0, min(100.0, progress))
-            
-            # Update progress bar
-            self._progress.set(progress)
-            
-            # Update message if provided
+            if progress >= 100.0 or time.monotonic() - self._last_flush >= 0.05:
+                if self._idle_after_id is None:
+                    self._idle_after_id = self.after_idle(self._flush_on_idle)
+            elif self._flush_after_id is None:
+                self._flush_after_id = self.after(50, self._flush_on_timer)
+        except tk.TclError:
+            pass  # Dialog already destroyed
+    
+    def _flush_on_idle(self):
+        """Idle callback scheduled by update_progress."""
+        self._idle_after_id = None
+        self._flush_progress()
+    
+    def _flush_on_timer(self):
+        """Timer callback scheduled by update_progress."""
+        self._flush_after_id = None
+        self._flush_progress()
+    
+    def _flush_progress(self):
+        """Write the latest pending progress and message to the widgets."""
+        progress = self._pending_progress
+        message = self._pending_message
+        if progress is None and message is None:
+            return
+        self._pending_progress = None
+        self._pending_message = None
+        self._last_flush = time.monotonic()
+        
+        try:
+            if progress is not None:
+                self._progress.set(progress)
+                
+                # Only reconfigure the percentage label when it changes
+                pct = int(progress)
+                if pct != self._last_pct:
+                    self._last_pct = pct
+                    self.progress_label.config(text=f"{pct}%")
             if message:
                 self._message.set(message)
-                
-            # Force update
-            self.update_idletasks()
-            
         except Exception:
             pass
     
@@ -156,12 +267,19 @@ class LoadingDialog(tk.Toplevel):
         """
         Update only the status message.
         
+        Safe to call from any thread registered with watch_thread().
+        
         Args:
             message: New status message
         """
+        if not self._on_ui_thread():
+            self._latest["message"] = message
+            return
+        
+        # A newer message supersedes one still waiting on a progress flush
+        self._pending_message = None
         try:
             self._message.set(message)
-            self.update_idletasks()
         except Exception:
             pass
     
@@ -169,9 +287,15 @@ class LoadingDialog(tk.Toplevel):
         """
         Set the progress bar mode.
         
+        Safe to call from any thread registered with watch_thread().
+        
         Args:
             mode: Either 'determinate' (shows progress) or 'indeterminate' (animated)
         """
+        if not self._on_ui_thread():
+            self._latest["mode"] = mode
+            return
+        
         try:
             if mode == 'indeterminate':
                 self.progress_bar.config(mode='indeterminate')
@@ -184,11 +308,14 @@ class LoadingDialog(tk.Toplevel):
     
     def is_cancelled(self) -> bool:
         """Check if loading was cancelled."""
-        return self._is_cancelled
+        return self._cancelled.is_set()
     
     def wait_for_cancellation(self, timeout: float = None) -> bool:
         """
-        Wait for cancellation event.
+        Wait for the loading to be cancelled.
+        
+        Meant for worker threads; blocks without polling until the user
+        cancels or the timeout expires.
         
         Args:
             timeout: Timeout in seconds (None for no timeout)
@@ -196,10 +323,18 @@ class LoadingDialog(tk.Toplevel):
         Returns:
             True if cancelled, False if timeout
         """
-        return self._cancelled_event.wait(timeout)
+        return self._cancelled.wait(timeout)
     
     def close(self):
         """Close the loading dialog."""
+        for after_id in (self._flush_after_id, self._idle_after_id, self._pump_after_id):
+            if after_id is not None:
+                try:
+                    self.after_cancel(after_id)
+                except Exception:
+                    pass
+        self._flush_after_id = self._idle_after_id = self._pump_after_id = None
+        
         try:
             self.grab_release()
             self.destroy()
@@ -228,6 +363,7 @@ class FileLoadingDialog(LoadingDialog):
         self.filename = filename
         self._file_size = 0
         self._bytes_read = 0
+        self._last_reported_pct = -1.0
         
     def set_file_size(self, size_bytes: int):
         """
@@ -238,7 +374,7 @@ class FileLoadingDialog(LoadingDialog):
         """
         self._file_size = size_bytes
         if size_bytes > 0:
-            self.update_message(f"Loading {self.filename} ({self._format_size(size_bytes)})")
+            self.update_message(f"Loading {self.filename} ({format_size(size_bytes)})")
     
     def update_bytes_read(self, bytes_read: int, message: str = None):
         """
@@ -251,25 +387,15 @@ class FileLoadingDialog(LoadingDialog):
         self._bytes_read = bytes_read
         
         if self._file_size > 0:
-            # Calculate percentage
-            progress = (bytes_read / self._file_size) * 100.0
+            # Calculate percentage in half-percent steps; finer changes are
+            # not visible on the bar and are skipped entirely
+            progress = int(bytes_read * 200 / self._file_size) / 2.0
+            if progress == self._last_reported_pct and not message:
+                return
+            self._last_reported_pct = progress
             self.update_progress(progress, message)
         else:
             # Indeterminate mode for unknown file sizes
             self.set_progress_mode('indeterminate')
             if message:
                 self.update_message(message)
-    
-    def _format_size(self, size_bytes: int) -> str:
-        """Format file size in human-readable format."""
-        try:
-            if size_bytes < 1024:
-                return f"{size_bytes} B"
-            elif size_bytes < 1024 * 1024:
-                return f"{size_bytes / 1024:.1f} KB"
-            elif size_bytes < 1024 * 1024 * 1024:
-                return f"{size_bytes / (1024 * 1024):.1f} MB"
-            else:
-                return f"{size_bytes / (1024 * 1024 * 1024):.1f} GB"
-        except Exception:
-            return f"{size_bytes} bytes"
@@ -15,6 +15,24 @@ from src.managers import ConfigManager, ThemeManager
 from src.utils.constants import DEFAULT_THEME
 
 
+# Combobox choices, shared by every dialog instance
+FONT_FAMILIES = ("Consolas", "Courier New", "Monaco", "DejaVu Sans Mono")
+ICONS = ("default.ico", "dark.ico", "light.ico", "sunset.ico")
+FILTER_MODES = ("Contains", "Starts With", "Ends With", "Regular Expression", "Exact Match", "Not Contains")
+ENCODINGS = ("auto", "utf-8", "utf-16-le", "utf-16-be", "latin-1")
+
+# Theme preview sample as (text, theme field) pieces. The text is inserted
+# once; pieces with a field are tagged and refilled from the selected theme.
+_PREVIEW_SAMPLE = (
+    ("Theme Preview: ", None), ("-", "name"),
+    ("\n\nThis is a sample of how text will appear with the ", None), ("-", "name"),
+    (" theme.\n\nFeatures:\n• Background: ", None), ("-", "text_bg"),
+    ("\n• Text: ", None), ("-", "text_fg"),
+    ("\n• Cursor: ", None), ("-", "insert_bg"),
+    ("\n\nThe theme will be applied to the entire application when you click OK or Apply.", None),
+)
+_PREVIEW_FIELDS = ("name", "text_bg", "text_fg", "insert_bg")
+
 class SettingsDialog(tk.Toplevel):
     """
     Comprehensive settings dialog for the Log Viewer application.
@@ -41,6 +59,10 @@ class SettingsDialog(tk.Toplevel):
         self.config_manager = config_manager
         self.theme_manager = theme_manager
         
+        # The theme list does not change while the dialog is open
+        self._theme_names = theme_manager.get_theme_names()
+        self._theme_display_names = theme_manager.get_theme_display_names()
+        
         # Dialog setup
         self.title("Log Viewer Settings")
         self.geometry("600x500")
@@ -53,6 +75,15 @@ class SettingsDialog(tk.Toplevel):
         # Center dialog on parent
         self._center_on_parent(parent)
         
+        # Settings variables exist up front so that loading and applying
+        # settings works whether or not a tab has been built yet
+        self._create_variables()
+        
+        # Tabs whose widgets are built the first time they are selected
+        self._pending_tabs = {}
+        self.preview_text = None
+        self._last_preview_theme = None
+        
         # Build the interface
         self._build_ui()
         
@@ -67,7 +98,9 @@ class SettingsDialog(tk.Toplevel):
     
     def _center_on_parent(self, parent):
         """Center the dialog on its parent window."""
-        parent.update_idletasks()
+        # Only force pending geometry work if the parent is not laid out yet
+        if parent.winfo_width() <= 1:
+            parent.update_idletasks()
         
         # Get parent position and size
         parent_x = parent.winfo_x()
@@ -99,12 +132,13 @@ class SettingsDialog(tk.Toplevel):
         self.notebook = ttk.Notebook(main_frame)
         self.notebook.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
         
-        # Create tabs
-        self._create_display_tab()
-        self._create_performance_tab()
-        self._create_theme_tab()
-        self._create_filter_tab()
-        self._create_file_tab()
+        # Create tabs; only the first one is built now
+        self._add_tab("Display", self._create_display_tab, lazy=False)
+        self._add_tab("Performance", self._create_performance_tab)
+        self._add_tab("Themes", self._create_theme_tab)
+        self._add_tab("Filtering", self._create_filter_tab)
+        self._add_tab("File Handling", self._create_file_tab)
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
         
         # Buttons frame
         button_frame = ttk.Frame(main_frame)
@@ -125,24 +159,95 @@ class SettingsDialog(tk.Toplevel):
         ttk.Button(button_frame, text="OK", 
                   command=self._on_ok).pack(side=tk.RIGHT, padx=(5, 0))
     
-    def _create_display_tab(self):
-        """Create the display settings tab."""
-        display_frame = ttk.Frame(self.notebook, padding="10")
-        self.notebook.add(display_frame, text="Display")
+    def _create_variables(self):
+        """Create the Tk variables backing every settings control."""
+        # Display
+        self.font_size_var = tk.IntVar()
+        self.font_family_var = tk.StringVar()
+        self.show_line_numbers_var = tk.BooleanVar()
+        self.word_wrap_var = tk.BooleanVar()
+        self.auto_scroll_var = tk.BooleanVar()
+        self.icon_var = tk.StringVar()
+        
+        # Performance
+        self.refresh_rate_var = tk.IntVar()
+        self.max_lines_var = tk.IntVar()
+        
+        # Themes
+        self.theme_var = tk.StringVar()
+        
+        # Filtering
+        self.default_filter_mode_var = tk.StringVar()
+        self.case_sensitive_var = tk.BooleanVar()
+        self.remember_history_var = tk.BooleanVar()
+        self.max_history_var = tk.IntVar()
+        
+        # File handling
+        self.auto_detect_encoding_var = tk.BooleanVar()
+        self.remember_encoding_var = tk.BooleanVar()
+        self.default_encoding_var = tk.StringVar()
+        self.remember_last_file_var = tk.BooleanVar()
+        self.remember_last_directory_var = tk.BooleanVar()
         
+        # Configuration key -> (variable, fallback when the key is missing).
+        # The theme is handled separately since its combobox shows display
+        # names rather than theme identifiers.
+        self._var_map = {
+            'display.font_size': (self.font_size_var, 11),
+            'display.font_family': (self.font_family_var, 'Consolas'),
+            'display.show_line_numbers': (self.show_line_numbers_var, True),
+            'display.word_wrap': (self.word_wrap_var, False),
+            'display.auto_scroll': (self.auto_scroll_var, True),
+            'display.icon': (self.icon_var, 'default.ico'),
+            'display.refresh_rate': (self.refresh_rate_var, 500),
+            'display.max_lines': (self.max_lines_var, 0),
+            'filter.default_mode': (self.default_filter_mode_var, 'Contains'),
+            'filter.case_sensitive': (self.case_sensitive_var, False),
+            'filter.remember_history': (self.remember_history_var, True),
+            'filter.max_history': (self.max_history_var, 20),
+            'file.auto_detect_encoding': (self.auto_detect_encoding_var, True),
+            'file.remember_encoding': (self.remember_encoding_var, True),
+            'file.default_encoding': (self.default_encoding_var, 'auto'),
+            'file.remember_last_file': (self.remember_last_file_var, True),
+            'file.remember_last_directory': (self.remember_last_directory_var, True),
+        }
+    
+    def _add_tab(self, text: str, builder, lazy: bool = True):
+        """
+        Add a notebook tab.
+        
+        Args:
+            text: Tab label
+            builder: Method that fills the tab's frame with its widgets
+            lazy: Defer building the widgets until the tab is first selected
+        """
+        frame = ttk.Frame(self.notebook, padding="10")
+        self.notebook.add(frame, text=text)
+        if lazy:
+            self._pending_tabs[str(frame)] = builder
+        else:
+            builder(frame)
+    
+    def _on_tab_changed(self, event=None):
+        """Build the selected tab's widgets if this is its first selection."""
+        tab_id = self.notebook.select()
+        builder = self._pending_tabs.pop(tab_id, None)
+        if builder:
+            builder(self.nametowidget(tab_id))
+    
+    def _create_display_tab(self, display_frame):
+        """Create the display settings tab."""
         # Font settings
         font_frame = ttk.LabelFrame(display_frame, text="Font Settings", padding="5")
         font_frame.pack(fill=tk.X, pady=(0, 10))
         
         ttk.Label(font_frame, text="Font Size:").grid(row=0, column=0, sticky=tk.W, padx=(0, 10))
-        self.font_size_var = tk.IntVar()
         font_size_spin = ttk.Spinbox(font_frame, from_=8, to=24, textvariable=self.font_size_var, width=10)
         font_size_spin.grid(row=0, column=1, sticky=tk.W)
         
         ttk.Label(font_frame, text="Font Family:").grid(row=1, column=0, sticky=tk.W, padx=(0, 10), pady=(5, 0))
-        self.font_family_var = tk.StringVar()
         font_family_combo = ttk.Combobox(font_frame, textvariable=self.font_family_var, 
-                                        values=["Consolas", "Courier New", "Monaco", "DejaVu Sans Mono"], 
+                                        values=FONT_FAMILIES, 
                                         width=15, state="readonly")
         font_family_combo.grid(row=1, column=1, sticky=tk.W, pady=(5, 0))
         
@@ -150,15 +255,12 @@ class SettingsDialog(tk.Toplevel):
         options_frame = ttk.LabelFrame(display_frame, text="Display Options", padding="5")
         options_frame.pack(fill=tk.X, pady=(0, 10))
         
-        self.show_line_numbers_var = tk.BooleanVar()
         ttk.Checkbutton(options_frame, text="Show Line Numbers", 
                        variable=self.show_line_numbers_var).pack(anchor=tk.W)
         
-        self.word_wrap_var = tk.BooleanVar()
         ttk.Checkbutton(options_frame, text="Word Wrap", 
                        variable=self.word_wrap_var).pack(anchor=tk.W)
         
-        self.auto_scroll_var = tk.BooleanVar()
         ttk.Checkbutton(options_frame, text="Auto-scroll to End", 
                        variable=self.auto_scroll_var).pack(anchor=tk.W)
         
@@ -167,44 +269,44 @@ class SettingsDialog(tk.Toplevel):
         icon_frame.pack(fill=tk.X, pady=(0, 10))
         
         ttk.Label(icon_frame, text="Icon:").pack(anchor=tk.W)
-        self.icon_var = tk.StringVar()
         icon_combo = ttk.Combobox(icon_frame, textvariable=self.icon_var, 
-                                 values=["default.ico", "dark.ico", "light.ico", "sunset.ico"], 
+                                 values=ICONS, 
                                  width=20, state="readonly")
         icon_combo.pack(anchor=tk.W, pady=(5, 0))
     
-    def _create_performance_tab(self):
+    def _create_performance_tab(self, perf_frame):
         """Create the performance settings tab."""
-        perf_frame = ttk.Frame(self.notebook, padding="10")
-        self.notebook.add(perf_frame, text="Performance")
-        
         # Refresh settings
         refresh_frame = ttk.LabelFrame(perf_frame, text="Refresh Settings", padding="5")
         refresh_frame.pack(fill=tk.X, pady=(0, 10))
         
         ttk.Label(refresh_frame, text="Refresh Rate (ms):").pack(anchor=tk.W)
-        self.refresh_rate_var = tk.IntVar()
         refresh_spin = ttk.Spinbox(refresh_frame, from_=100, to=5000, increment=100, 
                                  textvariable=self.refresh_rate_var, width=10)
         refresh_spin.pack(anchor=tk.W, pady=(5, 0))
         
+        # Display limits
+        limits_frame = ttk.LabelFrame(perf_frame, text="Display Limits", padding="5")
+        limits_frame.pack(fill=tk.X, pady=(0, 10))
+        
+        ttk.Label(limits_frame, text="Maximum Displayed Lines (0 = unlimited):").pack(anchor=tk.W)
+        max_lines_spin = ttk.Spinbox(limits_frame, from_=0, to=10000000, increment=10000, 
+                                     textvariable=self.max_lines_var, width=10)
+        max_lines_spin.pack(anchor=tk.W, pady=(5, 0))
+        
 
         
 
     
-    def _create_theme_tab(self):
+    def _create_theme_tab(self, theme_frame):
         """Create the theme settings tab."""
-        theme_frame = ttk.Frame(self.notebook, padding="10")
-        self.notebook.add(theme_frame, text="Themes")
-        
         # Theme selection
         selection_frame = ttk.LabelFrame(theme_frame, text="Theme Selection", padding="5")
         selection_frame.pack(fill=tk.X, pady=(0, 10))
         
         ttk.Label(selection_frame, text="Current Theme:").pack(anchor=tk.W)
-        self.theme_var = tk.StringVar()
         theme_combo = ttk.Combobox(selection_frame, textvariable=self.theme_var, 
-                                  values=self.theme_manager.get_theme_display_names(), 
+                                  values=self._theme_display_names, 
                                   width=20, state="readonly")
         theme_combo.pack(anchor=tk.W, pady=(5, 0))
         
@@ -214,23 +316,22 @@ class SettingsDialog(tk.Toplevel):
         
         self.preview_text = tk.Text(preview_frame, height=8, wrap=tk.WORD)
         self.preview_text.pack(fill=tk.BOTH, expand=True)
+        for text, field in _PREVIEW_SAMPLE:
+            self.preview_text.insert(tk.END, text, ("preview_" + field,) if field else ())
         
         # Bind theme change to preview update
         theme_combo.bind('<<ComboboxSelected>>', self._update_theme_preview)
+        self._update_theme_preview()
     
-    def _create_filter_tab(self):
+    def _create_filter_tab(self, filter_frame):
         """Create the filter settings tab."""
-        filter_frame = ttk.Frame(self.notebook, padding="10")
-        self.notebook.add(filter_frame, text="Filtering")
-        
         # Default filter settings
         default_frame = ttk.LabelFrame(filter_frame, text="Default Filter Settings", padding="5")
         default_frame.pack(fill=tk.X, pady=(0, 10))
         
         ttk.Label(default_frame, text="Default Filter Mode:").pack(anchor=tk.W)
-        self.default_filter_mode_var = tk.StringVar()
         filter_mode_combo = ttk.Combobox(default_frame, textvariable=self.default_filter_mode_var, 
-                                        values=["Contains", "Starts With", "Ends With", "Regular Expression", "Exact Match", "Not Contains"], 
+                                        values=FILTER_MODES, 
                                         width=20, state="readonly")
         filter_mode_combo.pack(anchor=tk.W, pady=(5, 0))
         
@@ -238,40 +339,31 @@ class SettingsDialog(tk.Toplevel):
         options_frame = ttk.LabelFrame(filter_frame, text="Filter Options", padding="5")
         options_frame.pack(fill=tk.X, pady=(0, 10))
         
-        self.case_sensitive_var = tk.BooleanVar()
         ttk.Checkbutton(options_frame, text="Case Sensitive by Default", 
                        variable=self.case_sensitive_var).pack(anchor=tk.W)
         
-        self.remember_history_var = tk.BooleanVar()
         ttk.Checkbutton(options_frame, text="Remember Filter History", 
                        variable=self.remember_history_var).pack(anchor=tk.W)
         
         ttk.Label(options_frame, text="Maximum History Items:").pack(anchor=tk.W, pady=(10, 0))
-        self.max_history_var = tk.IntVar()
         history_spin = ttk.Spinbox(options_frame, from_=5, to=100, textvariable=self.max_history_var, width=10)
         history_spin.pack(anchor=tk.W, pady=(5, 0))
     
-    def _create_file_tab(self):
+    def _create_file_tab(self, file_frame):
         """Create the file handling settings tab."""
-        file_frame = ttk.Frame(self.notebook, padding="10")
-        self.notebook.add(file_frame, text="File Handling")
-        
         # Encoding settings
         encoding_frame = ttk.LabelFrame(file_frame, text="File Encoding", padding="5")
         encoding_frame.pack(fill=tk.X, pady=(0, 10))
         
-        self.auto_detect_encoding_var = tk.BooleanVar()
         ttk.Checkbutton(encoding_frame, text="Auto-detect File Encoding", 
                        variable=self.auto_detect_encoding_var).pack(anchor=tk.W)
         
-        self.remember_encoding_var = tk.BooleanVar()
         ttk.Checkbutton(encoding_frame, text="Remember Encoding for Files", 
                        variable=self.remember_encoding_var).pack(anchor=tk.W)
         
         ttk.Label(encoding_frame, text="Default Encoding:").pack(anchor=tk.W, pady=(10, 0))
-        self.default_encoding_var = tk.StringVar()
         encoding_combo = ttk.Combobox(encoding_frame, textvariable=self.default_encoding_var, 
-                                     values=["auto", "utf-8", "utf-16-le", "utf-16-be", "latin-1"], 
+                                     values=ENCODINGS, 
                                      width=15, state="readonly")
         encoding_combo.pack(anchor=tk.W, pady=(5, 0))
         
@@ -279,63 +371,54 @@ class SettingsDialog(tk.Toplevel):
         file_options_frame = ttk.LabelFrame(file_frame, text="File Options", padding="5")
         file_options_frame.pack(fill=tk.X)
         
-        self.remember_last_file_var = tk.BooleanVar()
         ttk.Checkbutton(file_options_frame, text="Remember Last Opened File", 
                        variable=self.remember_last_file_var).pack(anchor=tk.W)
         
-        self.remember_last_directory_var = tk.BooleanVar()
         ttk.Checkbutton(file_options_frame, text="Remember Last Directory", 
                        variable=self.remember_last_directory_var).pack(anchor=tk.W)
     
     def _load_current_settings(self):
         """Load current settings from configuration manager."""
-        # Display settings
-        self.font_size_var.set(self.config_manager.get('display.font_size', 11))
-        self.font_family_var.set(self.config_manager.get('display.font_family', 'Consolas'))
-        self.show_line_numbers_var.set(self.config_manager.get('display.show_line_numbers', True))
-        self.word_wrap_var.set(self.config_manager.get('display.word_wrap', False))
-        self.auto_scroll_var.set(self.config_manager.get('display.auto_scroll', True))
-        
-        # Performance settings
-        self.refresh_rate_var.set(self.config_manager.get('display.refresh_rate', 500))
-
+        specs = [(key_path, default) for key_path, (_, default) in self._var_map.items()]
+        specs.append(('theme.current', DEFAULT_THEME))
+        self._set_variables(self.config_manager.get_many(specs))
+    
+    def _set_variables(self, values: Dict[str, Any]):
+        """
+        Set the dialog's variables from configuration values.
+        
+        Variables back every tab, built or not, since _apply_settings reads
+        them all; only the theme preview depends on its tab being built.
+        
+        Args:
+            values: Value for each _var_map key path and 'theme.current'
+        """
+        for key_path, (var, _) in self._var_map.items():
+            var.set(values[key_path])
         
         # Theme settings
-        current_theme = self.config_manager.get('theme.current', DEFAULT_THEME)
-        theme_names = self.theme_manager.get_theme_names()
-        if current_theme in theme_names:
-            theme_index = theme_names.index(current_theme)
-            self.theme_var.set(self.theme_manager.get_theme_display_names()[theme_index])
-        
-        # Filter settings
-        self.default_filter_mode_var.set(self.config_manager.get('filter.default_mode', 'Contains'))
-        self.case_sensitive_var.set(self.config_manager.get('filter.case_sensitive', False))
-        self.remember_history_var.set(self.config_manager.get('filter.remember_history', True))
-        self.max_history_var.set(self.config_manager.get('filter.max_history', 20))
-        
-        # File settings
-        self.auto_detect_encoding_var.set(self.config_manager.get('file.auto_detect_encoding', True))
-        self.remember_encoding_var.set(self.config_manager.get('file.remember_encoding', True))
-        self.default_encoding_var.set(self.config_manager.get('file.default_encoding', 'auto'))
-        self.remember_last_file_var.set(self.config_manager.get('file.remember_last_file', True))
-        self.remember_last_directory_var.set(self.config_manager.get('file.remember_last_directory', True))
+        current_theme = values['theme.current']
+        if current_theme in self._theme_names:
+            theme_index = self._theme_names.index(current_theme)
+            self.theme_var.set(self._theme_display_names[theme_index])
         
         # Update theme preview
         self._update_theme_preview()
-        
-        # Icon settings
-        self.icon_var.set(self.config_manager.get('display.icon', 'default.ico'))
     
     def _update_theme_preview(self, event=None):
         """Update the theme preview text."""
+        if self.preview_text is None:
+            return  # Themes tab not built yet
         try:
             # Get selected theme
             theme_display_name = self.theme_var.get()
-            theme_names = self.theme_manager.get_theme_display_names()
             
-            if theme_display_name in theme_names:
-                theme_index = theme_names.index(theme_display_name)
-                theme_name = self.theme_manager.get_theme_names()[theme_index]
+            if theme_display_name in self._theme_display_names:
+                theme_index = self._theme_display_names.index(theme_display_name)
+                theme_name = self._theme_names[theme_index]
+                if theme_name == self._last_preview_theme:
+                    return  # Preview already shows this theme
+                self._last_preview_theme = theme_name
                 theme = self.theme_manager.get_theme(theme_name)
                 
                 # Apply theme to preview
@@ -345,20 +428,14 @@ class SettingsDialog(tk.Toplevel):
                     insertbackground=theme["insert_bg"]
                 )
                 
-                # Sample text
-                sample_text = f"""Theme Preview: {theme['name']}
-
-This is a sample of how text will appear with the {theme['name']} theme.
-
-Features:
-• Background: {theme['text_bg']}
-• Text: {theme['text_fg']}
-• Cursor: {theme['insert_bg']}
-
-The theme will be applied to the entire application when you click OK or Apply."""
-                
-                self.preview_text.delete('1.0', tk.END)
-                self.preview_text.insert('1.0', sample_text)
+                # Refill only the theme-specific pieces of the sample text,
+                # last range first so earlier indices stay valid
+                for field in _PREVIEW_FIELDS:
+                    tag = "preview_" + field
+                    ranges = self.preview_text.tag_ranges(tag)
+                    for i in range(len(ranges) - 2, -1, -2):
+                        self.preview_text.delete(ranges[i], ranges[i + 1])
+                        self.preview_text.insert(ranges[i], theme[field], tag)
         except Exception:
             pass
     
@@ -369,47 +446,30 @@ The theme will be applied to the entire application when you click OK or Apply."
         if messagebox.askyesno("Reset Settings", 
                               "Are you sure you want to reset all settings to default values?\n\n"
                               "This action cannot be undone."):
-            self.config_manager.reset_to_defaults()
-            self._load_current_settings()
+            defaults = self.config_manager.reset_to_defaults()
+            values = {}
+            for key_path, (_, fallback) in self._var_map.items():
+                section, name = key_path.split('.')
+                values[key_path] = defaults.get(section, {}).get(name, fallback)
+            values['theme.current'] = defaults.get('theme', {}).get('current', DEFAULT_THEME)
+            self._set_variables(values)
             messagebox.showinfo("Settings Reset", "All settings have been reset to default values.")
     
     def _apply_settings(self):
         """Apply current settings to configuration."""
         try:
-            # Save display settings
-            self.config_manager.set('display.font_size', self.font_size_var.get())
-            self.config_manager.set('display.font_family', self.font_family_var.get())
-            self.config_manager.set('display.show_line_numbers', self.show_line_numbers_var.get())
-            self.config_manager.set('display.word_wrap', self.word_wrap_var.get())
-            self.config_manager.set('display.auto_scroll', self.auto_scroll_var.get())
-            self.config_manager.set('display.icon', self.icon_var.get())
+            updates = {key_path: var.get()
+                       for key_path, (var, _) in self._var_map.items()}
             
-            # Save performance settings
-            self.config_manager.set('display.refresh_rate', self.refresh_rate_var.get())
-    
-            
-            # Save theme settings
+            # Theme settings
             theme_display_name = self.theme_var.get()
-            theme_names = self.theme_manager.get_theme_display_names()
-            if theme_display_name in theme_names:
-                theme_index = theme_names.index(theme_display_name)
-                theme_name = self.theme_manager.get_theme_names()[theme_index]
-                self.config_manager.set('theme.current', theme_name)
-            
-            # Save filter settings
-            self.config_manager.set('filter.default_mode', self.default_filter_mode_var.get())
-            self.config_manager.set('filter.case_sensitive', self.case_sensitive_var.get())
-            self.config_manager.set('filter.remember_history', self.remember_history_var.get())
-            self.config_manager.set('filter.max_history', self.max_history_var.get())
-            
-            # Save file settings
-            self.config_manager.set('file.auto_detect_encoding', self.auto_detect_encoding_var.get())
-            self.config_manager.set('file.remember_encoding', self.remember_encoding_var.get())
-            self.config_manager.set('file.default_encoding', self.default_encoding_var.get())
-            self.config_manager.set('file.remember_last_file', self.remember_last_file_var.get())
-            self.config_manager.set('file.remember_last_directory', self.remember_last_directory_var.get())
+            if theme_display_name in self._theme_display_names:
+                theme_index = self._theme_display_names.index(theme_display_name)
+                updates['theme.current'] = self._theme_names[theme_index]
             
-            # Save configuration
+            # Write only what changed, and save once
+            if not self.config_manager.update(updates):
+                return
             self.config_manager.save_config()
             
             # Refresh the main window's UI to reflect the new settings immediately
@@ -8,10 +8,14 @@ Built on Tkinter for cross-platform compatibility.
 """
 
 import os
+import re
 import sys
 import time
+import queue
+import select
+import array
+import threading
 import tkinter as tk
-import collections
 from tkinter import ttk, filedialog, messagebox
 from typing import Optional
 
@@ -20,10 +24,30 @@ from src.utils.constants import (
     APP_NAME, APP_VERSION, APP_DESCRIPTION, APP_AUTHOR,
     DEFAULT_REFRESH_MS, DEFAULT_ENCODING, DEFAULT_THEME,
     FILTER_DEBOUNCE_MS, MIN_WINDOW_WIDTH, MIN_WINDOW_HEIGHT,
-    LINE_NUMBER_WIDTH, BUILD_NUMBER
+    LINE_NUMBER_WIDTH, BUILD_NUMBER, FILTER_QUEUE_CHUNKS, FILTER_DRAIN_MS,
+    POLL_BACKOFF_MAX_MS, FILE_WATCH_FALLBACK_SECONDS, FILTER_CHUNK_LINES,
+    LOAD_RENDER_CHARS
 )
 from .dialogs import SettingsDialog, FileLoadingDialog
 
+# Tcl before 9.0 stores text as UTF-16, so a character outside the Basic
+# Multilingual Plane takes up two columns in a text widget index
+_TK_SURROGATE_COLUMNS = tk.TclVersion < 9.0
+
+
+def _tk_column(line: str, offset: int) -> int:
+    """
+    Convert a string offset into a Tk text column for the same position.
+    
+    Args:
+        line: Line the offset points into
+        offset: Offset in Python characters
+        
+    Returns:
+        Column of that position in a Tk text widget
+    """
+    return offset + sum(1 for char in line[:offset] if char > "\uffff")
+
 
 class LogViewerApp(tk.Tk):
     """
@@ -83,6 +107,8 @@ class LogViewerApp(tk.Tk):
         # File handling
         self.path = path
         self.file_manager = FileManager(path, encoding=encoding) if path else None
+        if self.file_manager:
+            self.file_manager.set_truncation_callback(self._on_file_truncated)
         
         # Load settings from configuration with fallbacks to defaults
         self.refresh_ms = tk.IntVar(value=self.config_manager.get('display.refresh_rate', refresh_ms))
@@ -90,16 +116,44 @@ class LogViewerApp(tk.Tk):
         self.wrap = tk.BooleanVar(value=self.config_manager.get('display.word_wrap', False))
         self.show_line_numbers = tk.BooleanVar(value=self.config_manager.get('display.show_line_numbers', True))
         self.paused = tk.BooleanVar(value=False)
+        self._max_display_lines = self.config_manager.get('display.max_lines', 0)  # 0 = unlimited
+        
+        # Background file reading: the reader thread owns read_new_text and
+        # hands results to the UI through _read_queue
+        self._file_lock = threading.RLock()  # Serializes FileManager use between the reader and the UI
+        self._read_queue = queue.SimpleQueue()  # ("text" | "truncated" | "error", payload) from the reader
+        self._reader_stop = threading.Event()
+        self._reader_paused = threading.Event()  # Mirrors self.paused for the reader thread
+        self._reader_interval = self.refresh_ms.get()  # Mirrors self.refresh_ms for the reader thread
 
         # Filtering variables
         self.filter_text = tk.StringVar(value="")
         self.case_sensitive = tk.BooleanVar(value=False)
         self.filter_mode = tk.StringVar(value="contains")
         self._filter_job = None  # Debounce handle for filter updates
+        self._highlight_job = None  # Pending highlight refresh while typing a filter
+        self._filter_stop = None  # Cancels the background filter of an in-progress rebuild
+        self._last_filter = None  # Filter key whose complete result _filtered_line_nos holds, if any
 
         # Data storage for efficient filtering and display
-        self._line_buffer = collections.deque()  # Raw lines storage - no size limit
-        self._filtered_lines = []  # Store filtered lines with original line numbers
+        self._line_buffer = []  # Raw lines storage - no size limit; appended in place, replaced rather than cleared
+        self._filtered_line_nos = array.array('q')  # Original line numbers of the lines in the filtered view
+        self._pending_chunks = []  # Appended text waiting for the next idle flush
+        self._trimmed_lines = 0  # Lines dropped from the top of the unfiltered view
+        self._append_job = None  # after_idle handle of the pending flush
+        self._load_job = None  # after_idle handle of the next slice of a file being displayed
+        self._load_text = ""  # Text of the file being displayed in slices
+        self._load_pos = 0  # How much of _load_text is in the widget
+        self._load_lines = 0  # Buffer lines covered by _load_text
+        self._linenum_job = None  # after_idle handle of the pending line numbers refresh
+        self._gutter_state = None  # (source, first number, count) of the line numbers shown
+        self._applied_theme = None  # Theme last applied by _apply_theme
+        self._applied_icon = None  # display.icon value last applied by _set_app_icon
+        self._prefs_dirty = False  # Preferences changed but not yet written to disk
+        self._prefs_job = None  # Pending delayed preferences save
+        self._poll_job = None  # Next run of _poll
+        self._heartbeat_job = None  # Next heartbeat animation frame
+        self._style = ttk.Style(self)  # Reused by _apply_theme for toolbar styling
 
         # Build the user interface
         self._build_ui()
@@ -110,8 +164,7 @@ class LogViewerApp(tk.Tk):
             if saved_theme != DEFAULT_THEME:
                 self.theme_manager.set_theme(saved_theme)
                 # Update menu checkmarks to reflect saved theme
-                for name, var in self.theme_vars.items():
-                    var.set(name == saved_theme)
+                self.theme_var.set(self.theme_manager.current_theme)
         
         # Set application icon based on current theme
         self._set_app_icon()
@@ -135,8 +188,10 @@ class LogViewerApp(tk.Tk):
         if self.path:
             self._open_path(self.path, first_open=True)
             
-        # Start the polling loop for file updates
-        self.after(self.refresh_ms.get(), self._poll)
+        # Start reading file updates in the background, and the loop that
+        # displays them
+        threading.Thread(target=self._file_reader_loop, daemon=True).start()
+        self._poll_job = self.after(self.refresh_ms.get(), self._poll)
         
         # Start the heartbeat
         self._start_heartbeat()
@@ -173,14 +228,17 @@ class LogViewerApp(tk.Tk):
         
         # Theme submenu with checkmarks for current selection
         theme_menu = tk.Menu(view_menu, tearoff=0)
-        self.theme_vars = {}
+        # One variable holds the current theme; each entry is checked when
+        # the variable equals its onvalue
+        self.theme_var = tk.StringVar(value=self.theme_manager.current_theme)
+        themes = self.theme_manager.THEMES
         # Only show themes that are fully available (have icon files)
         for theme_name in self.theme_manager.get_available_themes():
-            var = tk.BooleanVar(value=(theme_name == self.theme_manager.current_theme))
-            self.theme_vars[theme_name] = var
             theme_menu.add_checkbutton(
-                label=self.theme_manager.get_theme(theme_name)["name"],
-                variable=var,
+                label=themes[theme_name].name,
+                variable=self.theme_var,
+                onvalue=theme_name,
+                offvalue="",
                 command=lambda t=theme_name: self._change_theme(t)
             )
         view_menu.add_cascade(label="Theme", menu=theme_menu)
@@ -309,10 +367,14 @@ class LogViewerApp(tk.Tk):
         self.filter_status_label = ttk.Label(filter_controls_frame, text="", width=8)
         self.filter_status_label.pack(side=tk.LEFT, padx=(4, 0))
         
-        # Bind filter events for real-time updates
-        self.filter_text.trace_add('write', lambda *args: self._on_filter_change())
+        # Bind filter events for real-time updates. Edits are picked up from
+        # the entry's own events rather than a variable trace; clipboard
+        # edits apply after the entry's class binding, hence after_idle.
+        # The Case checkbutton calls _on_filter_change through its command.
+        self.filter_entry.bind('<KeyRelease>', lambda event: self._on_filter_change())
+        for sequence in ('<<Paste>>', '<<Cut>>', '<<Clear>>', '<<PasteSelection>>'):
+            self.filter_entry.bind(sequence, lambda event: self.after_idle(self._on_filter_change))
         self.filter_mode_combo.bind('<<ComboboxSelected>>', self._on_filter_mode_change)
-        self.case_sensitive.trace_add('write', lambda *args: self._on_filter_change())
         
         # Set initial filter mode
         self.filter_mode_combo.set(self.filter_manager.get_mode_display_names()[0])
@@ -334,6 +396,8 @@ class LogViewerApp(tk.Tk):
             relief=tk.FLAT,             # No border
             borderwidth=0,              # No border width
             state=tk.DISABLED,          # Read-only
+            exportselection=False,      # Never claims the X selection
+            undo=False,                 # No undo stack for programmatic rewrites
             font=("Consolas", 11)       # Monospace font for alignment
         )
         
@@ -342,6 +406,8 @@ class LogViewerApp(tk.Tk):
             text_content_frame,
             wrap=tk.WORD if self.wrap.get() else tk.NONE,  # Word wrap based on setting
             undo=False,                  # Disable undo for performance
+            autoseparators=False,        # No undo separators on each insert
+            maxundo=0,                   # Keep no undo history even if undo is enabled
             font=("Consolas", 11),      # Monospace font for log readability
             selectbackground="#0078d4",  # Blue selection background
             selectforeground="white",    # White selection text
@@ -369,8 +435,8 @@ class LogViewerApp(tk.Tk):
         self.xscroll = xscroll
         
         # Bind events for line numbers synchronization
-        self.text.bind('<KeyRelease>', self._update_line_numbers)
-        self.text.bind('<ButtonRelease-1>', self._update_line_numbers)
+        self.text.bind('<KeyRelease>', self._schedule_line_numbers_update)
+        self.text.bind('<ButtonRelease-1>', self._schedule_line_numbers_update)
         self.text.bind('<MouseWheel>', self._on_mouse_wheel)  # Windows mouse wheel
         self.text.bind('<Button-4>', self._on_mouse_wheel)    # Linux scroll up
         self.text.bind('<Button-5>', self._on_mouse_wheel)    # Linux scroll down
@@ -412,12 +478,12 @@ class LogViewerApp(tk.Tk):
             
             # Apply theme colors to status bar immediately
             self.status.configure(
-                background=theme["status_bg"],
-                foreground=theme["status_fg"]
+                background=theme.status_bg,
+                foreground=theme.status_fg
             )
             
             # Also apply to main window background
-            self.configure(bg=theme["bg"])
+            self.configure(bg=theme.bg)
             
         except Exception:
             # Silently fail if theme colors can't be applied initially
@@ -431,12 +497,12 @@ class LogViewerApp(tk.Tk):
             
             # Ensure status bar has correct colors
             self.status.configure(
-                background=theme["status_bg"],
-                foreground=theme["status_fg"]
+                background=theme.status_bg,
+                foreground=theme.status_fg
             )
             
             # Ensure main window background is correct
-            self.configure(bg=theme["bg"])
+            self.configure(bg=theme.bg)
             
             # Force update to ensure colors are applied
             self.update_idletasks()
@@ -500,10 +566,14 @@ class LogViewerApp(tk.Tk):
         Set the application icon based on user preference.
         
         Uses the icon selected in settings, with fallback to default icon.
+        Does nothing if that icon preference is already applied.
         """
         try:
             # Get user's preferred icon from configuration
             preferred_icon = self.config_manager.get('display.icon', 'default.ico')
+            if preferred_icon == self._applied_icon:
+                return
+            self._applied_icon = preferred_icon
             
             # Build path to the preferred icon
             icon_path = os.path.join(os.path.dirname(__file__), "..", "..", "icons", preferred_icon)
@@ -528,48 +598,52 @@ class LogViewerApp(tk.Tk):
         Apply the current theme to all UI elements.
         
         Updates colors and styling for all interface components
-        including text widgets, toolbar, status bar, and menus.
+        including text widgets, toolbar, status bar, and menus. Does
+        nothing if the theme is already applied.
         """
         theme = self.theme_manager.get_current_theme()
+        if theme is self._applied_theme:
+            return  # Themes are immutable, so nothing would change
+        self._applied_theme = theme
         
         # Configure main window
-        self.configure(bg=theme["bg"])
+        self.configure(bg=theme.bg)
         
         # Configure text widget
         self.text.configure(
-            bg=theme["text_bg"],
-            fg=theme["text_fg"],
-            insertbackground=theme["insert_bg"],
-            selectbackground=theme["menu_select_bg"],
-            selectforeground=theme["text_fg"]
+            bg=theme.text_bg,
+            fg=theme.text_fg,
+            insertbackground=theme.insert_bg,
+            selectbackground=theme.menu_select_bg,
+            selectforeground=theme.text_fg
         )
         
         # Configure line numbers widget
         if hasattr(self, 'line_numbers'):
             self.line_numbers.configure(
-                bg=theme["text_bg"],
-                fg=theme["text_fg"],
-                insertbackground=theme["insert_bg"],
-                selectbackground=theme["menu_select_bg"],
-                selectforeground=theme["text_fg"]
+                bg=theme.text_bg,
+                fg=theme.text_fg,
+                insertbackground=theme.insert_bg,
+                selectbackground=theme.menu_select_bg,
+                selectforeground=theme.text_fg
             )
         
         # Configure toolbar (if using ttk, this may have limited effect)
         try:
-            style = ttk.Style()
-            style.configure("Toolbar.TFrame", background=theme["toolbar_bg"])
-            style.configure("Toolbar.TLabel", background=theme["toolbar_bg"], foreground=theme["toolbar_fg"])
-            style.configure("Toolbar.TButton", background=theme["button_bg"], foreground=theme["button_fg"])
-            style.configure("Toolbar.TEntry", fieldbackground=theme["entry_bg"], foreground=theme["entry_fg"])
-            style.configure("Toolbar.TCheckbutton", background=theme["toolbar_bg"], foreground=theme["toolbar_fg"])
-            style.configure("Toolbar.TSpinbox", fieldbackground=theme["entry_bg"], foreground=theme["entry_fg"])
+            style = self._style
+            style.configure("Toolbar.TFrame", background=theme.toolbar_bg)
+            style.configure("Toolbar.TLabel", background=theme.toolbar_bg, foreground=theme.toolbar_fg)
+            style.configure("Toolbar.TButton", background=theme.button_bg, foreground=theme.button_fg)
+            style.configure("Toolbar.TEntry", fieldbackground=theme.entry_bg, foreground=theme.entry_fg)
+            style.configure("Toolbar.TCheckbutton", background=theme.toolbar_bg, foreground=theme.toolbar_fg)
+            style.configure("Toolbar.TSpinbox", fieldbackground=theme.entry_bg, foreground=theme.entry_fg)
         except Exception:
             pass  # ttk styling may not work on all platforms
         
         # Configure status bar
         self.status.configure(
-            background=theme["status_bg"],
-            foreground=theme["status_fg"]
+            background=theme.status_bg,
+            foreground=theme.status_fg
         )
         
         # Ensure status bar colors are properly set and not overridden
@@ -577,15 +651,15 @@ class LogViewerApp(tk.Tk):
         
         # Configure menu colors (limited support on some platforms)
         try:
-            self.option_add('*Menu.background', theme["menu_bg"])
-            self.option_add('*Menu.foreground', theme["menu_fg"])
-            self.option_add('*Menu.selectBackground', theme["menu_select_bg"])
+            self.option_add('*Menu.background', theme.menu_bg)
+            self.option_add('*Menu.foreground', theme.menu_fg)
+            self.option_add('*Menu.selectBackground', theme.menu_select_bg)
         except Exception:
             pass
         
         # Update theme indicator
         if hasattr(self, 'theme_label'):
-            self.theme_label.configure(text=f"🎨 {theme['name']}")
+            self.theme_label.configure(text=f"🎨 {theme.name}")
         
         # Update application icon to match theme
         self._set_app_icon()
@@ -627,11 +701,16 @@ class LogViewerApp(tk.Tk):
             loading_dialog.update_message(f"Opening {filename}...")
             self.update_idletasks()
         
+        # Keep the reader thread away from the file while it is (re)opened
+        self._file_lock.acquire()
         try:
+            # Anything the reader queued belongs to the previous file
+            self._discard_queued_reads()
+            
             if not self.file_manager:
                 self.file_manager = FileManager(path)
                 # Set up truncation callback for automatic file reloading
-                self.file_manager.set_truncation_callback(self._handle_file_truncation)
+                self.file_manager.set_truncation_callback(self._on_file_truncated)
             else:
                 # Force re-detection of encoding for the file (even if same path)
                 self.file_manager.force_encoding_detection()
@@ -657,14 +736,11 @@ class LogViewerApp(tk.Tk):
                 text = self.file_manager.read_entire_file()
             
             if text:
-                # For new files, use _load_file_content instead of _append
-                if not first_open:
-                    self._load_file_content(text)
-                else:
-                    self._append(text)
+                # Display the whole file without filtering, in slices
+                self._load_file_content(text)
                                 
                 self._set_heartbeat_state("active")
-                self._set_status(f"File loaded ({len(text.splitlines()):,} lines)")
+                self._set_status(f"File loaded ({len(self._line_buffer):,} lines)")
             else:
                 self._set_heartbeat_state("active")
                 self._set_status("File opened (empty)")
@@ -676,6 +752,7 @@ class LogViewerApp(tk.Tk):
             self._set_heartbeat_state("error")
             self._set_status("Open failed")
         finally:
+            self._file_lock.release()
             # Always close the loading dialog
             if loading_dialog:
                 loading_dialog.close()
@@ -695,11 +772,14 @@ class LogViewerApp(tk.Tk):
                 # Clear current view and reload file
                 self._clear_current_view()
                 
-                # Read entire file again
-                text = self.file_manager.read_entire_file()
+                # Read entire file again; updates the reader queued since
+                # the truncation are part of what is re-read
+                with self._file_lock:
+                    self._discard_queued_reads()
+                    text = self.file_manager.read_entire_file()
                 if text:
                     self._load_file_content(text)
-                    self._set_status(f"File reloaded after truncation ({len(text.splitlines()):,} lines)")
+                    self._set_status(f"File reloaded after truncation ({len(self._line_buffer):,} lines)")
                 else:
                     self._set_status("File reloaded (empty after truncation)")
                     
@@ -707,31 +787,117 @@ class LogViewerApp(tk.Tk):
             self._set_heartbeat_state("error")
             self._set_status(f"Error reloading truncated file: {e}")
     
+    def _on_file_truncated(self):
+        """
+        FileManager truncation callback.
+        
+        Runs on the reader thread, so it only queues the event; _poll
+        reloads the file from the Tk thread.
+        """
+        self._read_queue.put(("truncated", None))
+    
+    def _discard_queued_reads(self):
+        """Drop text the reader queued; callers hold _file_lock and re-read the file."""
+        kept = []
+        try:
+            while True:
+                item = self._read_queue.get_nowait()
+                if item[0] != "text":
+                    kept.append(item)
+        except queue.Empty:
+            pass
+        for item in kept:
+            if item[0] != "truncated":
+                self._read_queue.put(item)
+    
+    def _file_reader_loop(self):
+        """
+        Read new file content on a background thread.
+        
+        Keeps file I/O off the Tk thread so slow storage cannot stall the
+        UI. Where the file has a change-notification descriptor (inotify),
+        the thread sleeps in select() until the file changes, waking at
+        least every FILE_WATCH_FALLBACK_SECONDS. Otherwise it polls, with
+        an interval that starts at the configured refresh rate and doubles
+        after every read that finds nothing, up to POLL_BACKOFF_MAX_MS.
+        Results are queued for _poll; Tk is never touched from here.
+        """
+        interval = self._reader_interval
+        while not self._reader_stop.is_set():
+            file_manager = self.file_manager
+            fd = None
+            if file_manager is not None and not self._reader_paused.is_set():
+                fd = file_manager.watch_fileno()
+            if fd is not None:
+                try:
+                    select.select([fd], [], [], FILE_WATCH_FALLBACK_SECONDS)
+                except (OSError, ValueError):
+                    # The descriptor was closed by a reopen; retry shortly
+                    self._reader_stop.wait(interval / 1000.0)
+            else:
+                self._reader_stop.wait(interval / 1000.0)
+            
+            base = max(100, self._reader_interval)
+            if self._reader_stop.is_set() or self._reader_paused.is_set():
+                interval = base
+                continue
+            
+            got_text = False
+            try:
+                with self._file_lock:
+                    if self.file_manager and self.path:
+                        text = self.file_manager.read_new_text()
+                        if text:
+                            got_text = True
+                            self._read_queue.put(("text", text))
+            except Exception as e:
+                self._read_queue.put(("error", e))
+            
+            interval = base if got_text else max(base, min(interval * 2, POLL_BACKOFF_MAX_MS))
+    
     def _poll(self):
         """
         Main polling loop for file updates.
         
-        Checks for new content in the monitored file at regular intervals.
-        Handles errors gracefully and reschedules itself for continuous monitoring.
+        Displays whatever the reader thread has queued since the last call
+        and reschedules itself at the configured refresh rate. Handles
+        errors gracefully so monitoring continues.
         """
         try:
-            if not self.paused.get() and self.file_manager and self.path:
-                new_text = self.file_manager.read_new_text()
-                if new_text:
-                    self._append(new_text)
+            texts = []
+            while True:
+                try:
+                    kind, payload = self._read_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if kind == "text":
+                    texts.append(payload)
+                elif kind == "truncated":
+                    texts.clear()  # The reload below includes them
+                    self._handle_file_truncation()
+                else:
+                    # Non-fatal: show in status bar, keep polling
+                    self._set_heartbeat_state("error")
+                    self._set_status("Error: {}".format(payload))
+            
+            # The reader has already moved past this text in the file, so it
+            # is kept even if the view was paused after it was read; the
+            # reader itself stops reading while paused
+            if texts:
+                self._append("".join(texts))
+                if not self.paused.get():
                     self._set_heartbeat_state("active")
                     self._set_status("Updated")
         except Exception as e:
-            # Non-fatal: show in status bar, keep polling
             self._set_heartbeat_state("error")
             self._set_status("Error: {}".format(e))
         finally:
-            # Reschedule polling
             try:
                 interval = max(100, int(self.refresh_ms.get()))
             except Exception:
                 interval = DEFAULT_REFRESH_MS
-            self.after(interval, self._poll)
+            self._reader_interval = interval
+            self._poll_job = self.after(interval, self._poll)
     
     def _on_closing(self):
         """
@@ -740,6 +906,10 @@ class LogViewerApp(tk.Tk):
         Called when the user closes the application window.
         Saves all current settings and window state before exit.
         """
+        # Stop the background file reader and pending Tk callbacks
+        self._reader_stop.set()
+        self._cancel_pending_callbacks()
+        
         try:
             # Save current window state
             self.config_manager.save_window_state(self)
@@ -768,7 +938,11 @@ class LogViewerApp(tk.Tk):
                 if last_dir:
                     self.config_manager.set('file.last_directory', last_dir)
             
-            # Save configuration
+            # Save configuration (this also covers any delayed preferences save)
+            if self._prefs_job is not None:
+                self.after_cancel(self._prefs_job)
+                self._prefs_job = None
+            self._prefs_dirty = False
             self.config_manager.save_config()
             
         except Exception as e:
@@ -777,6 +951,26 @@ class LogViewerApp(tk.Tk):
         # Destroy the window
         self.destroy()
     
+    def _cancel_pending_callbacks(self):
+        """
+        Cancel scheduled after() callbacks before the window is destroyed.
+        
+        Otherwise Tk may still run them during teardown, against widgets
+        that are already gone. The delayed preferences save is left to
+        _on_closing, which writes the configuration itself.
+        """
+        self._heartbeat_active = False
+        self._cancel_filter_stream()
+        for name in ('_poll_job', '_heartbeat_job', '_filter_job', '_highlight_job',
+                     '_append_job', '_linenum_job', '_wheel_sync_job'):
+            job = getattr(self, name, None)
+            if job is not None:
+                try:
+                    self.after_cancel(job)
+                except Exception:
+                    pass
+                setattr(self, name, None)
+    
     def _set_status(self, msg):
         """
         Update the status bar with a message.
@@ -836,7 +1030,7 @@ class LogViewerApp(tk.Tk):
             self._heartbeat_index = (self._heartbeat_index + 1) % len(heartbeat_chars)
             
             # Schedule next heartbeat update
-            self.after(self._heartbeat_interval, self._update_heartbeat)
+            self._heartbeat_job = self.after(self._heartbeat_interval, self._update_heartbeat)
             
         except Exception:
             # Silently fail to avoid breaking the main functionality
@@ -888,7 +1082,7 @@ class LogViewerApp(tk.Tk):
                     self.status.configure(foreground="orange")
                 else:  # active - restore theme foreground color
                     theme = self.theme_manager.get_current_theme()
-                    self.status.configure(foreground=theme["status_fg"])
+                    self.status.configure(foreground=theme.status_fg)
             except Exception:
                 # Silently fail if color change is not supported
                 pass
@@ -942,8 +1136,11 @@ class LogViewerApp(tk.Tk):
             if not filter_text:
                 self._clear_highlighting()
             else:
-                # For immediate feedback, apply highlighting to current content
-                self.after(50, self._refresh_highlighting)
+                # For immediate feedback, apply highlighting to current
+                # content; one refresh per pause in typing, not per keystroke
+                if self._highlight_job is not None:
+                    self.after_cancel(self._highlight_job)
+                self._highlight_job = self.after(50, self._run_highlight_refresh)
     
     def _update_filter_status(self):
         """
@@ -981,7 +1178,7 @@ class LogViewerApp(tk.Tk):
         """
         self.filter_text.set("")
         self.filter_manager.clear_filter()
-        self._filtered_lines = []  # Clear filtered lines when filter is cleared
+        self._filtered_line_nos = array.array('q')  # Clear filtered lines when filter is cleared
         
         # Clear all highlighting tags
         self._clear_highlighting()
@@ -996,12 +1193,19 @@ class LogViewerApp(tk.Tk):
         
         Used when opening a new file to ensure clean state.
         """
+        # Stop any background filter still feeding the old view
+        self._cancel_filter_stream()
+        
         # Clear text widget
         self.text.delete('1.0', tk.END)
+        self._trimmed_lines = 0
         
-        # Clear all buffers
-        self._line_buffer.clear()
-        self._filtered_lines = []
+        # Clear all buffers; a new list, since a cancelled filter thread may
+        # still be reading the old one
+        self._line_buffer = []
+        self._filtered_line_nos = array.array('q')
+        self._last_filter = None
+        self._pending_chunks.clear()
         
         # Clear any active filters
         self.filter_text.set("")
@@ -1011,17 +1215,26 @@ class LogViewerApp(tk.Tk):
         self._clear_highlighting()
         
         # Update line numbers
-        self._update_line_numbers()
+        self._schedule_line_numbers_update()
     
     def _rebuild_view(self):
         """
         Re-render the text widget from the buffered lines using the current filter.
         
-        This method efficiently rebuilds the display by applying the current
-        filter to all stored lines, maintaining original line numbers for
-        accurate reference.
+        Filtering runs on a worker thread over a snapshot of the buffer and
+        streams matches back in chunks, which _drain_filtered_lines inserts
+        from the Tk event loop, so large buffers never freeze the UI.
+        Original line numbers are kept for accurate reference.
         """
         try:
+            self._cancel_filter_stream()
+            
+            # The rebuilt view is highlighted when it completes; a refresh
+            # still pending from typing would only highlight the old view
+            if self._highlight_job is not None:
+                self.after_cancel(self._highlight_job)
+                self._highlight_job = None
+            
             # If no active filter, restore original view
             if not self.filter_manager.current_filter:
                 self._restore_original_view()
@@ -1030,38 +1243,161 @@ class LogViewerApp(tk.Tk):
             # Ensure text widget is in normal state for editing
             self.text.config(state=tk.NORMAL)
             
+            # A filter that extends the previous one (typing "err" then
+            # "error") can only match a subset of the previous matches
+            if self._narrows_last_filter():
+                self._narrow_view()
+                return
+            self._last_filter = None
+            
             # Clear current display
             self.text.delete('1.0', tk.END)
-            at_end = True
-            matched_count = 0
-            total_count = len(self._line_buffer)
+            self._trimmed_lines = 0
             
-            # Store filtered lines with their original line numbers
-            self._filtered_lines = []
+            # Store the original line numbers of the filtered lines
+            self._filtered_line_nos = array.array('q')
             
-            # First, collect all matching lines
-            matching_lines = []
-            for i, line in enumerate(self._line_buffer, 1):
-                if self.filter_manager.matches(line):
-                    matching_lines.append((i, line))
-                    matched_count += 1
+            # Filter the buffer's current lines in the background; the
+            # buffer is only appended to, so no copy is needed, and lines
+            # appended meanwhile are picked up when the stream completes.
+            # The worker gets its own copy of the filter, since typing
+            # changes the manager while the stream is still running.
+            snapshot = self.filter_manager.snapshot()
+            total_count = len(self._line_buffer)
+            results = queue.Queue(maxsize=FILTER_QUEUE_CHUNKS)
+            stop = threading.Event()
+            self._filter_stop = stop
+            threading.Thread(
+                target=snapshot.filter_stream,
+                args=(self._line_buffer, results, stop),
+                kwargs={"numbered": True, "count": total_count},
+                daemon=True
+            ).start()
+            self._set_status(f"Filtering {total_count} lines...")
+            self.after(FILTER_DRAIN_MS, self._drain_filtered_lines, results, stop, total_count, snapshot)
+                
+        except Exception as e:
+            self._set_status("Filter error: {}".format(e))
+    
+    def _filter_key(self, fm: Optional[FilterManager] = None) -> tuple:
+        """Identify a filter (default: the current one) as (text, mode, case_sensitive)."""
+        if fm is None:
+            fm = self.filter_manager
+        return (fm.current_filter, fm.current_mode, fm.case_sensitive)
+    
+    def _narrows_last_filter(self) -> bool:
+        """
+        Check whether the current filter only narrows the previous result.
+        
+        True when the previous filter's full result is at hand and
+        FilterManager.is_refinement_of reports that the current filter can
+        only match a subset of it. Not used when display.max_lines has
+        trimmed matches from the view, or for results too large to refilter
+        in one go.
+        """
+        last = self._last_filter
+        if last is None or self._filter_stop is not None or self._max_display_lines > 0:
+            return False
+        return (len(self._filtered_line_nos) <= FILTER_CHUNK_LINES
+                and self.filter_manager.is_refinement_of(*last))
+    
+    def _narrow_view(self):
+        """Rebuild the filtered view by refiltering the previous matches only."""
+        previous = self._filtered_line_nos
+        buffer = self._line_buffer
+        matches = self.filter_manager.filter_lines([buffer[num - 1] for num in previous], numbered=True, start=0)
+        self._filtered_line_nos = array.array('q', [previous[index] for index, _ in matches])
+        
+        self.text.delete('1.0', tk.END)
+        self._trimmed_lines = 0
+        self.text.insert(tk.END, "".join(line for _, line in matches))
+        self._finish_rebuild_view(len(self._line_buffer))
+    
+    def _cancel_filter_stream(self):
+        """Abandon a filtered rebuild or file display that is still in progress."""
+        if self._filter_stop is not None:
+            self._filter_stop.set()
+            self._filter_stop = None
+        if self._load_job is not None:
+            try:
+                self.after_cancel(self._load_job)
+            except Exception:
+                pass
+            self._load_job = None
+            self._load_text = ""
+    
+    def _drain_filtered_lines(self, results: queue.Queue, stop: threading.Event, total_count: int,
+                              snapshot: FilterManager):
+        """
+        Insert filtered chunks produced by the background filter.
+        
+        Runs from the Tk event loop and works for at most one frame
+        (FILTER_DRAIN_MS) per call before rescheduling itself.
+        
+        Args:
+            results: Queue of (line_number, line) chunks, None at the end
+            stop: Cancellation event of the stream being drained
+            total_count: Number of lines in the filtered snapshot
+            snapshot: Copy of the filter the stream is applying
+        """
+        if stop.is_set():
+            return  # Superseded by a newer rebuild or a cleared filter
+        
+        try:
+            deadline = time.monotonic() + FILTER_DRAIN_MS / 1000.0
+            while time.monotonic() < deadline:
+                try:
+                    chunk = results.get_nowait()
+                except queue.Empty:
+                    break
+                if chunk is None:
+                    self._finish_rebuild_view(total_count, snapshot)
+                    return
+                if chunk:
+                    self.text.insert(tk.END, "".join(line for _, line in chunk))
+                    self._filtered_line_nos.extend([num for num, _ in chunk])
+        except Exception as e:
+            self._cancel_filter_stream()
+            self._set_status("Filter error: {}".format(e))
+            return
+        
+        self.after(FILTER_DRAIN_MS, self._drain_filtered_lines, results, stop, total_count, snapshot)
+    
+    def _finish_rebuild_view(self, total_count: int, snapshot: Optional[FilterManager] = None):
+        """
+        Complete a filtered rebuild once the background filter is done.
+        
+        Args:
+            total_count: Number of lines in the filtered snapshot
+            snapshot: Copy of the filter the view was built with (None for
+                the current filter)
+        """
+        fm = snapshot or self.filter_manager
+        self._filter_stop = None
+        # Record the filter the view was built with, not the current one:
+        # the filter may have been edited while the stream was running
+        self._last_filter = self._filter_key(fm)
+        try:
+            # Lines that arrived while filtering were not in the snapshot
+            if len(self._line_buffer) > total_count:
+                late_lines = self._line_buffer[total_count:]
+                late_matches = fm.filter_lines(late_lines, numbered=True, start=total_count + 1)
+                if late_matches:
+                    self.text.insert(tk.END, "".join(line for _, line in late_matches))
+                    self._filtered_line_nos.extend([num for num, _ in late_matches])
+            self._trim_widget()
             
-            # Then insert all matching lines at once
-            for i, line in matching_lines:
-                self.text.insert(tk.END, line)
-                self._filtered_lines.append((i, line))
+            at_end = True
+            matched_count = len(self._filtered_line_nos)
+            total_count = len(self._line_buffer)
             
             # Now apply highlighting to the complete filtered content
-            if matching_lines:
+            if self._filtered_line_nos:
                 self._highlight_all_filter_matches()
                 
             # Force update to ensure highlighting is applied
             self.text.update_idletasks()
             
-            # Ensure highlighting is applied even if the above didn't work
-            if matching_lines:
-                self.after(100, self._refresh_highlighting)
-            
             # Auto-scroll if configured and we were at the end
             if self.autoscroll.get() and at_end:
                 self.text.see(tk.END)
@@ -1073,7 +1409,7 @@ class LogViewerApp(tk.Tk):
                 self._set_status(f"Filtered: {matched_count}/{total_count} lines")
             
             # Update line numbers after rebuilding view
-            self._update_line_numbers()
+            self._schedule_line_numbers_update()
                 
         except Exception as e:
             self._set_status("Filter error: {}".format(e))
@@ -1086,6 +1422,9 @@ class LogViewerApp(tk.Tk):
         ensuring line numbers and content are correctly aligned.
         """
         try:
+            self._cancel_filter_stream()
+            self._last_filter = None
+            
             # Ensure text widget is in normal state for editing
             self.text.config(state=tk.NORMAL)
             
@@ -1093,11 +1432,12 @@ class LogViewerApp(tk.Tk):
             self.text.delete('1.0', tk.END)
             
             # Clear filtered lines tracking
-            self._filtered_lines = []
+            self._filtered_line_nos = array.array('q')
             
-            # Insert all original lines from buffer
-            for line in self._line_buffer:
-                self.text.insert(tk.END, line)
+            # Insert the original lines from the buffer in one call, leaving
+            # out any that a display limit would trim straight away
+            self._trimmed_lines = self._display_skip(len(self._line_buffer))
+            self.text.insert(tk.END, "".join(self._line_buffer[self._trimmed_lines:]))
             
             # Force update to ensure content is displayed
             self.text.update_idletasks()
@@ -1107,7 +1447,7 @@ class LogViewerApp(tk.Tk):
                 self.text.see(tk.END)
             
             # Update line numbers for unfiltered content
-            self._update_line_numbers()
+            self._schedule_line_numbers_update()
             
             # Update status
             total_count = len(self._line_buffer)
@@ -1163,33 +1503,14 @@ class LogViewerApp(tk.Tk):
         try:
             if not self.filter_manager.current_filter:
                 return
-                
-            filter_text = self.filter_manager.current_filter
-            filter_mode = self.filter_manager.current_mode
-            case_sensitive = self.filter_manager.case_sensitive
-            
-            # Configure highlight tag if not already configured
-            if not hasattr(self, '_highlight_tag_configured'):
-                self._configure_highlight_tags()
-                self._highlight_tag_configured = True
             
             # Get the complete text content that's currently displayed
             displayed_text = self.text.get('1.0', 'end-1c')
             if not displayed_text:
                 return
             
-            # Find and highlight matches based on filter mode
-            if filter_mode == "contains":
-                self._highlight_contains_matches_in_text(displayed_text, filter_text, case_sensitive)
-            elif filter_mode == "starts_with":
-                self._highlight_starts_with_matches_in_text(displayed_text, filter_text, case_sensitive)
-            elif filter_mode == "ends_with":
-                self._highlight_ends_with_matches_in_text(displayed_text, filter_text, case_sensitive)
-            elif filter_mode == "exact":
-                self._highlight_exact_matches_in_text(displayed_text, filter_text, case_sensitive)
-            elif filter_mode == "regex":
-                self._highlight_regex_matches_in_text(displayed_text, filter_text, case_sensitive)
-            # Note: "not_contains" mode doesn't need highlighting since it shows non-matching lines
+            # Tag every match in one batched call
+            self._highlight_lines('1.0', displayed_text.splitlines(True))
             
         except Exception:
             # Silently fail highlighting to avoid breaking the main functionality
@@ -1204,8 +1525,8 @@ class LogViewerApp(tk.Tk):
         
         # Get current theme's highlight colors
         theme = self.theme_manager.get_current_theme()
-        highlight_bg = theme.get('highlight_bg', '#ffeb3b')  # Fallback to yellow
-        highlight_fg = theme.get('highlight_fg', '#000000')  # Fallback to black
+        highlight_bg = theme.highlight_bg
+        highlight_fg = theme.highlight_fg
         
         # Create single highlight tag with theme colors
         self.text.tag_configure('filter_highlight', 
@@ -1218,138 +1539,6 @@ class LogViewerApp(tk.Tk):
 
 
     
-    def _highlight_contains_matches_in_text(self, displayed_text, filter_text, case_sensitive):
-        """Highlight all occurrences of the filter text in the displayed text."""
-        if not filter_text:
-            return
-        
-        # Use the text widget's search to find all occurrences
-        search_start = "1.0"
-        tag_index = 0
-        
-        while True:
-            # Search for the filter text in the entire text widget
-            found_pos = self.text.search(filter_text, search_start, "end", nocase=not case_sensitive)
-            if not found_pos:
-                break
-                
-            # Calculate end position
-            found_end = self.text.index(f"{found_pos}+{len(filter_text)}c")
-            
-            # Apply highlighting tag
-            self.text.tag_add('filter_highlight', found_pos, found_end)
-            
-            # Move to next position to avoid infinite loop
-            search_start = self.text.index(f"{found_pos}+1c")
-            tag_index += 1
-            
-            # Safety break to avoid infinite loops
-            if tag_index > 100:
-                break
-    
-    def _highlight_starts_with_matches_in_text(self, displayed_text, filter_text, case_sensitive):
-        """Highlight lines that start with the filter text."""
-        if not filter_text:
-            return
-        
-        # Split displayed text into lines and find matches
-        lines = displayed_text.splitlines()
-        tag_index = 0
-        
-        for i, line in enumerate(lines):
-            if case_sensitive:
-                if line.startswith(filter_text):
-                    line_start = f"{i+1}.0"
-                    line_end = f"{i+1}.{len(filter_text)}"
-                    tag_name = f'filter_highlight_{(tag_index % 5) + 1}'
-                    self.text.tag_add(tag_name, line_start, line_end)
-                    tag_index += 1
-            else:
-                if line.lower().startswith(filter_text.lower()):
-                    line_start = f"{i+1}.0"
-                    line_end = f"{i+1}.{len(filter_text)}"
-                    tag_name = f'filter_highlight_{(tag_index % 5) + 1}'
-                    self.text.tag_add(tag_name, line_start, line_end)
-                    tag_index += 1
-    
-    def _highlight_ends_with_matches_in_text(self, displayed_text, filter_text, case_sensitive):
-        """Highlight lines that end with the filter text."""
-        if not filter_text:
-            return
-        
-        # Split displayed text into lines and find matches
-        lines = displayed_text.splitlines()
-        tag_index = 0
-        
-        for i, line in enumerate(lines):
-            if case_sensitive:
-                if line.endswith(filter_text):
-                    line_start = f"{i+1}.{len(line) - len(filter_text)}"
-                    line_end = f"{i+1}.end"
-                    tag_name = f'filter_highlight_{(tag_index % 5) + 1}'
-                    self.text.tag_add(tag_name, line_start, line_end)
-                    tag_index += 1
-            else:
-                if line.lower().endswith(filter_text.lower()):
-                    line_start = f"{i+1}.{len(line) - len(filter_text)}"
-                    line_end = f"{i+1}.end"
-                    tag_name = f'filter_highlight_{(tag_index % 5) + 1}'
-                    self.text.tag_add(tag_name, line_start, line_end)
-                    tag_index += 1
-    
-    def _highlight_exact_matches_in_text(self, displayed_text, filter_text, case_sensitive):
-        """Highlight lines that exactly match the filter text."""
-        if not filter_text:
-            return
-        
-        # Split displayed text into lines and find matches
-        lines = displayed_text.splitlines()
-        tag_index = 0
-        
-        for i, line in enumerate(lines):
-            if case_sensitive:
-                if line.rstrip() == filter_text:
-                    line_start = f"{i+1}.0"
-                    line_end = f"{i+1}.end"
-                    tag_name = f'filter_highlight_{(tag_index % 5) + 1}'
-                    self.text.tag_add(tag_name, line_start, line_end)
-                    tag_index += 1
-            else:
-                if line.rstrip().lower() == filter_text.lower():
-                    line_start = f"{i+1}.0"
-                    line_end = f"{i+1}.end"
-                    tag_name = f'filter_highlight_{(tag_index % 5) + 1}'
-                    self.text.tag_add(tag_name, line_start, line_end)
-                    tag_index += 1
-    
-    def _highlight_regex_matches_in_text(self, displayed_text, filter_text, case_sensitive):
-        """Highlight regex pattern matches in the displayed text."""
-        if not filter_text:
-            return
-        
-        try:
-            import re
-            flags = 0 if case_sensitive else re.IGNORECASE
-            
-            # Split displayed text into lines and find matches
-            lines = displayed_text.splitlines()
-            tag_index = 0
-            
-            for i, line in enumerate(lines):
-                pattern = re.compile(filter_text, flags)
-                matches = list(pattern.finditer(line))
-                
-                for match in matches:
-                    line_start = f"{i+1}.{match.start()}"
-                    line_end = f"{i+1}.{match.end()}"
-                    tag_name = f'filter_highlight_{(tag_index % 5) + 1}'
-                    self.text.tag_add(tag_name, line_start, line_end)
-                    tag_index += 1
-                    
-        except Exception:
-            # If regex compilation fails, fall back to contains highlighting
-            self._highlight_contains_matches_in_text(displayed_text, filter_text, case_sensitive)
-    
     def _highlight_contains_matches(self, start_pos, end_pos, line_content, filter_text, case_sensitive):
         """Highlight all occurrences of the filter text in the line."""
         if not filter_text:
@@ -1430,11 +1619,8 @@ class LogViewerApp(tk.Tk):
             return
             
         try:
-            import re
-            flags = 0 if case_sensitive else re.IGNORECASE
-            
             # Find all matches of the regex pattern
-            pattern = re.compile(filter_text, flags)
+            pattern = self._highlight_pattern(filter_text, case_sensitive)
             matches = list(pattern.finditer(line_content))
             
             tag_index = 0
@@ -1451,6 +1637,90 @@ class LogViewerApp(tk.Tk):
             # If regex compilation fails, fall back to contains highlighting
             self._highlight_contains_matches(start_pos, end_pos, line_content, filter_text, case_sensitive)
     
+    def _highlight_lines(self, insert_at, lines):
+        """
+        Highlight filter matches in lines shown in the text widget.
+        
+        Match ranges are computed in Python and applied with a single
+        tag_add call, instead of searching the widget and tagging each
+        match with its own Tcl command.
+        
+        Args:
+            insert_at: Widget index where the first line starts
+            lines: The displayed lines, with line endings
+        """
+        try:
+            filter_text = self.filter_manager.current_filter
+            filter_mode = self.filter_manager.current_mode
+            case_sensitive = self.filter_manager.case_sensitive
+            if not filter_text or filter_mode == "not_contains":
+                return
+            
+            if not hasattr(self, '_highlight_tag_configured'):
+                self._configure_highlight_tags()
+                self._highlight_tag_configured = True
+            
+            # Loop-invariant lookups are bound to locals; this runs over
+            # every displayed line after a rebuild. Spans are found in the
+            # original line: folding a copy first (lower/casefold) can change
+            # its length and shift every column after the changed character.
+            if filter_mode == "regex":
+                pattern = self._highlight_pattern(filter_text, case_sensitive)
+            else:
+                pattern = re.compile(re.escape(filter_text), 0 if case_sensitive else re.IGNORECASE)
+            finditer = pattern.finditer if filter_mode in ("regex", "contains") else None
+            size = len(filter_text)
+            
+            row, col = map(int, insert_at.split("."))
+            ranges = []
+            add_range = ranges.extend
+            for raw_line in lines:
+                line = raw_line.rstrip("\r\n")
+                if finditer is not None:
+                    spans = [match.span() for match in finditer(line) if match.end() > match.start()]
+                elif filter_mode == "starts_with":
+                    spans = [(0, size)] if pattern.match(line) else []
+                elif filter_mode == "ends_with":
+                    spans = [(len(line) - size, len(line))] if len(line) >= size and pattern.fullmatch(line, len(line) - size) else []
+                elif filter_mode == "exact":
+                    spans = [(0, len(line))] if pattern.fullmatch(line.rstrip()) else []
+                else:
+                    spans = []
+                # Tk 8.6 counts characters outside the BMP as two columns
+                wide = _TK_SURROGATE_COLUMNS and not raw_line.isascii() and max(raw_line) > "\uffff"
+                for start, end in spans:
+                    if wide:
+                        start, end = _tk_column(line, start), _tk_column(line, end)
+                    add_range((f"{row}.{col + start}", f"{row}.{col + end}"))
+                # Only a newline starts a new widget line; splitlines() also
+                # breaks on characters like a lone "\r"
+                if raw_line.endswith("\n"):
+                    row += 1
+                    col = 0
+                else:
+                    col += _tk_column(raw_line, len(raw_line)) if wide else len(raw_line)
+            
+            if ranges:
+                self.text.tag_add('filter_highlight', *ranges)
+        except Exception:
+            # Silently fail highlighting to avoid breaking the main functionality
+            pass
+    
+    def _highlight_pattern(self, filter_text, case_sensitive):
+        """
+        Get the compiled pattern for regex highlighting.
+        
+        Uses the pattern FilterManager compiled when the filter was set, and
+        only compiles one here if none is available.
+        
+        Raises:
+            re.error: If the pattern is invalid
+        """
+        pattern = self.filter_manager.compiled_regex
+        if pattern is None:
+            pattern = re.compile(filter_text, 0 if case_sensitive else re.IGNORECASE)
+        return pattern
+    
     def _clear_highlighting(self):
         """Clear all highlighting tags from the text widget."""
         try:
@@ -1459,6 +1729,11 @@ class LogViewerApp(tk.Tk):
         except Exception:
             pass  # Silently fail to avoid breaking functionality
     
+    def _run_highlight_refresh(self):
+        """Timer callback scheduled by _on_filter_change."""
+        self._highlight_job = None
+        self._refresh_highlighting()
+    
     def _refresh_highlighting(self):
         """Refresh highlighting for the current filter on the displayed content."""
         try:
@@ -1486,16 +1761,15 @@ class LogViewerApp(tk.Tk):
     
     def _show_filter_history(self):
         """Show filter history in a popup menu."""
-        if not self.filter_manager.filter_history:
+        history = self.filter_manager.get_filter_history_items()
+        if not history:
             self._set_status("No filter history")
             return
         
         # Create popup menu
         history_menu = tk.Menu(self, tearoff=0)
         
-        for i, filter_text in enumerate(self.filter_manager.filter_history):
-            # Truncate long filter text for display
-            display_text = filter_text[:50] + "..." if len(filter_text) > 50 else filter_text
+        for i, (filter_text, display_text) in enumerate(history):
             history_menu.add_command(
                 label=f"{i+1}. {display_text}",
                 command=lambda text=filter_text: self._use_filter_from_history(text)
@@ -1521,6 +1795,10 @@ class LogViewerApp(tk.Tk):
         """
         self.paused.set(not self.paused.get())
         self.pause_btn.config(text="Resume" if self.paused.get() else "Pause")
+        if self.paused.get():
+            self._reader_paused.set()
+        else:
+            self._reader_paused.clear()
         
         # Update heartbeat state based on pause status
         if self.paused.get():
@@ -1561,17 +1839,39 @@ class LogViewerApp(tk.Tk):
         if self.show_line_numbers.get():
             # Make line numbers visible and update them
             self.line_numbers.pack(side=tk.LEFT, fill=tk.Y, before=self.text)
-            self._update_line_numbers()
+            self._schedule_line_numbers_update()
         else:
             # Hide line numbers
             self.line_numbers.pack_forget()
     
+    def _schedule_line_numbers_update(self, event=None):
+        """
+        Request a line numbers refresh on the next idle pass.
+        
+        Any number of requests before then (keystrokes, clicks, appends)
+        result in a single refresh. Nothing is scheduled while the line
+        numbers are hidden; showing them requests a refresh.
+        
+        Args:
+            event: Tkinter event that triggered the update (optional)
+        """
+        if self._linenum_job is None and self.show_line_numbers.get():
+            self._linenum_job = self.after_idle(self._run_line_numbers_update)
+    
+    def _run_line_numbers_update(self):
+        """Idle callback scheduled by _schedule_line_numbers_update."""
+        self._linenum_job = None
+        self._update_line_numbers()
+    
     def _update_line_numbers(self, event=None):
         """
         Update the line numbers display.
         
         Refreshes the line numbers widget to show current line numbers.
-        Handles both filtered and unfiltered content appropriately.
+        Handles both filtered and unfiltered content appropriately. When
+        the view has only grown since the last refresh, just the new
+        numbers are added; lines trimmed from the top of an unfiltered
+        view are dropped from the gutter the same way.
         
         Args:
             event: Tkinter event that triggered the update (optional)
@@ -1580,39 +1880,121 @@ class LogViewerApp(tk.Tk):
             return
             
         try:
+            # Right-justify line numbers; LINE_NUMBER_WIDTH - 1 accounts for
+            # the newline character
+            width = LINE_NUMBER_WIDTH - 1
+            
             # Check if we're showing filtered content
-            if hasattr(self, '_filtered_lines') and self._filtered_lines and self.filter_manager.current_filter:
-                # Show original line numbers for filtered content
-                self.line_numbers.config(state=tk.NORMAL)
-                self.line_numbers.delete('1.0', tk.END)
-                
-                for original_line_num, _ in self._filtered_lines:
-                    # Right-justify line numbers with proper formatting
-                    # Use LINE_NUMBER_WIDTH - 1 to account for the newline character
-                    formatted_line = f"{original_line_num:>{LINE_NUMBER_WIDTH - 1}}\n"
-                    self.line_numbers.insert(tk.END, formatted_line)
-                
-                self.line_numbers.config(state=tk.DISABLED)
+            if self._filtered_line_nos and self.filter_manager.current_filter:
+                # Show original line numbers for filtered content; the
+                # array is only appended to until it is replaced or trimmed
+                source = self._filtered_line_nos
+                first = source[0]
+                count = len(source)
+                numbers = lambda start: source[start:]
             else:
-                # Show sequential line numbers for unfiltered content
-                lines = self.text.get('1.0', tk.END).count('\n')
-                
+                # Show sequential line numbers for unfiltered content; the
+                # row of the last character is the widget's line count
+                source = None
+                first = self._trimmed_lines + 1
+                count = int(self.text.index('end-1c').split('.')[0])
+                numbers = lambda start: range(first + start, first + count)
+            
+            state = self._gutter_state
+            unchanged = (state is not None and state[0] is source
+                         and state[1] == first and state[2] == count)
+            
+            # Clicks and key presses in the view request a refresh without
+            # changing its lines; only the scroll position needs syncing
+            if not unchanged:
                 self.line_numbers.config(state=tk.NORMAL)
-                self.line_numbers.delete('1.0', tk.END)
-                
-                for i in range(1, lines + 1):
-                    # Right-justify line numbers with proper formatting
-                    # Use LINE_NUMBER_WIDTH - 1 to account for the newline character
-                    formatted_line = f"{i:>{LINE_NUMBER_WIDTH - 1}}\n"
-                    self.line_numbers.insert(tk.END, formatted_line)
+                shown = 0
+                if state is not None and state[0] is source:
+                    dropped = first - state[1]
+                    if source is None and 0 < dropped <= state[2]:
+                        # Unfiltered numbers depend only on the first number,
+                        # so lines trimmed from the view are dropped in place
+                        self.line_numbers.delete('1.0', f'{dropped + 1}.0')
+                        state = (source, first, state[2] - dropped)
+                    if state[1] == first and state[2] <= count:
+                        shown = state[2]
+                if not shown:
+                    self.line_numbers.delete('1.0', tk.END)
                 
+                # Build the missing numbers as one string and insert it once
+                if shown < count:
+                    self.line_numbers.insert(tk.END, "".join(f"{num:>{width}}\n" for num in numbers(shown)))
                 self.line_numbers.config(state=tk.DISABLED)
+                self._gutter_state = (source, first, count)
             
             # Sync scroll position
             self._sync_scroll()
         except Exception:
             pass
     
+    def _display_skip(self, line_count: int) -> int:
+        """
+        Number of leading lines to leave out when displaying line_count lines.
+        
+        Args:
+            line_count: Number of lines about to be displayed
+            
+        Returns:
+            Lines beyond display.max_lines, or 0 when there is no limit
+        """
+        max_lines = self._max_display_lines
+        if max_lines <= 0:
+            return 0
+        return max(0, line_count - max_lines)
+    
+    def _set_max_display_lines(self, max_lines: int):
+        """
+        Apply a new display.max_lines limit to the current view.
+        
+        A lower limit trims the widget in place. A higher limit (or none)
+        re-renders the view from the line buffer, so lines trimmed under
+        the old limit are shown again; nothing is redone when the limit
+        is unchanged.
+        
+        Args:
+            max_lines: New limit, 0 for unlimited
+        """
+        old = self._max_display_lines
+        if max_lines == old:
+            return
+        self._max_display_lines = max_lines
+        
+        raised = old > 0 and (max_lines <= 0 or max_lines > old)
+        if raised and (self._trimmed_lines or self.filter_manager.current_filter):
+            self._rebuild_view()
+        else:
+            self._trim_widget()
+    
+    def _trim_widget(self):
+        """
+        Drop the oldest lines from the text widget once it exceeds the limit.
+        
+        Keeps the view at display.max_lines lines (0 = unlimited). Trimming
+        waits until the view is 10% over the limit so that it happens in
+        occasional large deletes rather than on every append. The line
+        buffer is left whole, so filters still see every line.
+        """
+        max_lines = self._max_display_lines
+        if max_lines <= 0:
+            return
+        line_count = int(self.text.index('end-1c').split('.')[0])
+        if line_count <= max_lines * 1.1:
+            return
+        
+        excess = line_count - max_lines
+        self.text.delete('1.0', f'{excess + 1}.0')
+        
+        # Keep the gutter's numbering in step with what is still shown
+        if self.filter_manager.current_filter:
+            del self._filtered_line_nos[:excess]
+        else:
+            self._trimmed_lines += excess
+    
     def _sync_scroll(self):
         """
         Synchronize scroll position between text and line numbers.
@@ -1691,13 +2073,13 @@ class LogViewerApp(tk.Tk):
         Args:
             theme_name: Name of the theme to apply
         """
-        if self.theme_manager.set_theme(theme_name):
+        changed = self.theme_manager.set_theme(theme_name)
+        # Update theme menu checkmarks (clicking the checked entry unchecks it)
+        self.theme_var.set(self.theme_manager.current_theme)
+        if changed:
             self._apply_theme()
-            # Update theme menu checkmarks
-            for name, var in self.theme_vars.items():
-                var.set(name == theme_name)
             # Show theme change confirmation in status
-            self._set_status(f"Theme changed to {self.theme_manager.get_theme(theme_name)['name']}")
+            self._set_status(f"Theme changed to {self.theme_manager.get_theme(theme_name).name}")
     
     def _cycle_theme(self):
         """
@@ -1719,17 +2101,18 @@ class LogViewerApp(tk.Tk):
         Displays a dialog with list of available themes and
         keyboard shortcuts for theme switching.
         """
-        info = "Available Themes:\n\n"
+        parts = ["Available Themes:\n\n"]
         # Show all available themes
         available_themes = self.theme_manager.get_available_themes()
         for theme_name in available_themes:
             theme = self.theme_manager.get_theme(theme_name)
             current = " (Current)" if theme_name == self.theme_manager.current_theme else ""
-            info += f"• {theme['name']}{current}\n"
+            parts.append(f"• {theme.name}{current}\n")
         
-        info += "\nNote: Icon can be customized in Settings → Display → Application Icon.\n"
-        info += "\nUse Ctrl+T to cycle through themes\n"
-        info += "Or use View → Theme menu"
+        parts.append("\nNote: Icon can be customized in Settings → Display → Application Icon.\n")
+        parts.append("\nUse Ctrl+T to cycle through themes\n")
+        parts.append("Or use View → Theme menu")
+        info = "".join(parts)
         
         messagebox.showinfo("Theme Information", info)
     
@@ -1854,69 +2237,140 @@ class LogViewerApp(tk.Tk):
         self.text.config(state=tk.NORMAL)
         
         # Clear existing content first
+        self._cancel_filter_stream()
         self.text.delete('1.0', tk.END)
-        self._line_buffer.clear()
-        self._filtered_lines = []
+        self._filtered_line_nos = array.array('q')
+        self._pending_chunks.clear()
         
-        # Insert the entire content at once to preserve formatting
-        self.text.insert('1.0', s)
-        
-        # Make text widget read-only but allow selection
-        self.text.config(state=tk.NORMAL)
-        
-        # Break content into lines and store in buffer (for filtering later)
+        # Break content into lines and store in buffer (for filtering later);
+        # the list becomes the buffer rather than being copied into it
         lines = s.splitlines(True)  # keep line endings
-        if lines:
-            self._line_buffer.extend(lines)
+        self._line_buffer = lines
+        
+        # With a display limit only the lines that would survive trimming
+        # are inserted
+        self._trimmed_lines = self._display_skip(len(lines))
+        if self._trimmed_lines:
+            s = "".join(lines[self._trimmed_lines:])
+        
+        # Insert the content in slices from idle callbacks, so a large file
+        # does not freeze the window while it is displayed
+        self._load_text = s
+        self._load_pos = 0
+        self._load_lines = len(lines)
+        self._insert_load_slice()
+    
+    def _insert_load_slice(self):
+        """
+        Insert the next LOAD_RENDER_CHARS of the file being displayed.
+        
+        Reschedules itself with after_idle until the whole text is in the
+        widget, then shows lines appended in the meantime.
+        """
+        self._load_job = None
+        text = self._load_text
+        start = self._load_pos
+        end = text.find("\n", start + LOAD_RENDER_CHARS)
+        end = len(text) if end == -1 else end + 1
+        
+        self.text.insert(tk.END, text[start:end])
+        self._load_pos = end
+        if end < len(text):
+            self._load_job = self.after_idle(self._insert_load_slice)
+            return
+        self._load_text = ""
+        
+        # Lines read while the file was being displayed were held back
+        # by _flush_append
+        if len(self._line_buffer) > self._load_lines:
+            self.text.insert(tk.END, "".join(self._line_buffer[self._load_lines:]))
+            self._trim_widget()
         
         # Auto-scroll to end if configured
         if self.autoscroll.get():
             self.text.see(tk.END)
         
         # Update line numbers
-        self._update_line_numbers()
+        self._schedule_line_numbers_update()
     
     def _append(self, s: str):
         """
         Append new text to the display, applying current filter.
         
-        Processes incoming text chunk by chunk, stores lines in buffer,
-        and displays only lines that match the current filter.
+        Text is queued and displayed on the next idle pass, so bursts of
+        updates are coalesced into a single widget insert.
         
         Args:
             s: New text content to append
         """
+        if not s:
+            return
+        self._pending_chunks.append(s)
+        if self._append_job is None:
+            self._append_job = self.after_idle(self._flush_append)
+    
+    def _flush_append(self):
+        """
+        Display all text queued by _append.
+        
+        Stores the lines in the buffer and inserts only the lines that
+        match the current filter, in one insert.
+        """
+        self._append_job = None
+        if not self._pending_chunks:
+            return
+        s = "".join(self._pending_chunks)
+        self._pending_chunks.clear()
+        
         # Ensure text widget is in normal state for editing
         self.text.config(state=tk.NORMAL)
         
-        # Break incoming chunk into lines, store, and append only matching ones
+        # Break incoming text into lines, store, and append only matching ones
         lines = s.splitlines(True)  # keep line endings
         if not lines:
             return
-        at_end = (self.text.yview()[1] == 1.0)
+        # Whether the view sits at the bottom only matters while paused;
+        # otherwise autoscroll always follows the tail, so skip the query
+        paused = self.paused.get()
+        at_end = paused and self.text.yview()[1] >= 0.9999
+        first_line_number = len(self._line_buffer) + 1
         self._line_buffer.extend(lines)
         
-        # Apply current filter to new lines
-        matching_lines = []
-        for line in lines:
-            if self.filter_manager.matches(line):
-                matching_lines.append(line)
-        
-        # Insert all matching lines at once
-        for line in matching_lines:
-            self.text.insert(tk.END, line)
+        # A background rebuild or file display is still inserting earlier
+        # lines; it appends these once it finishes so the view stays in order
+        if self._filter_stop is not None or self._load_job is not None:
+            return
         
-        # Apply highlighting to all newly added content if there's an active filter
-        if self.filter_manager.current_filter and matching_lines:
-            self._highlight_all_filter_matches()
-            # Force update to ensure highlighting is applied
-            self.text.update_idletasks()
+        # Apply current filter to new lines only; the filtered view is
+        # extended in place rather than rebuilt from the whole buffer
+        if self.filter_manager.current_filter:
+            # Lines matched by a newer filter than the one the view was
+            # built for would make the result unsafe to narrow
+            if self._last_filter != self._filter_key():
+                self._last_filter = None
+            matches = self.filter_manager.filter_lines(lines, numbered=True, start=first_line_number)
+            self._filtered_line_nos.extend([num for num, _ in matches])
+            matching_lines = [line for _, line in matches]
+            new_text = "".join(matching_lines)
+        else:
+            # Every line is shown, so the joined chunks are inserted as is
+            matching_lines = lines
+            new_text = s
+        
+        # Insert all matching lines at once, then highlight matches in the
+        # new lines only (before trimming shifts the widget's line indices)
+        if matching_lines:
+            insert_at = self.text.index("end-1c")
+            self.text.insert(tk.END, new_text)
+            if self.filter_manager.current_filter:
+                self._highlight_lines(insert_at, matching_lines)
+            self._trim_widget()
         
-        if self.autoscroll.get() and (at_end or self.paused.get() is False):
+        if self.autoscroll.get() and (at_end or not paused):
             self.text.see(tk.END)
         
         # Update line numbers after appending new text
-        self._update_line_numbers()
+        self._schedule_line_numbers_update()
     
 
     
@@ -1927,10 +2381,25 @@ class LogViewerApp(tk.Tk):
         """
         Save current theme preference to the configuration system.
         
-        Stores the user's theme choice for restoration on next launch.
+        Stores the user's theme choice for restoration on next launch. The
+        configuration file is written a couple of seconds later, so several
+        quick theme changes cost one write.
         """
         try:
             self.config_manager.set('theme.current', self.theme_manager.current_theme)
+        except Exception:
+            return  # Silently fail if we can't save preferences
+        self._prefs_dirty = True
+        if self._prefs_job is None:
+            self._prefs_job = self.after(2000, self._flush_preferences)
+    
+    def _flush_preferences(self):
+        """Write the configuration file if preferences changed since the last write."""
+        self._prefs_job = None
+        if not self._prefs_dirty:
+            return
+        self._prefs_dirty = False
+        try:
             self.config_manager.save_config()
         except Exception:
             pass  # Silently fail if we can't save preferences
@@ -1947,6 +2416,7 @@ class LogViewerApp(tk.Tk):
             self.autoscroll.set(self.config_manager.get('display.auto_scroll', True))
             self.show_line_numbers.set(self.config_manager.get('display.show_line_numbers', True))
             self.refresh_ms.set(self.config_manager.get('display.refresh_rate', DEFAULT_REFRESH_MS))
+            self._set_max_display_lines(self.config_manager.get('display.max_lines', 0))
             
             # Apply any changed settings immediately
             self._apply_wrap()
@@ -6,25 +6,39 @@ This package contains utility modules including constants and helper functions.
 """
 
 from .constants import *
+from .formatting import format_size
 
 __all__ = [
 
     'DEFAULT_REFRESH_MS',
+    'POLL_BACKOFF_MAX_MS',
     'DEFAULT_ENCODING',
     'DEFAULT_THEME',
     'MAX_FILE_SIZE_FOR_FULL_LOAD',
+    'ENCODING_SNIFF_BYTES',
+    'MMAP_READ_THRESHOLD',
+    'DIRECT_READ_THRESHOLD',
+    'FILE_WATCH_FALLBACK_SECONDS',
+    'ROTATION_CHECK_SECONDS',
+    'PROGRESS_REPORT_BYTES',
     'MIN_WINDOW_WIDTH',
     'MIN_WINDOW_HEIGHT',
     'MAX_WINDOW_WIDTH',
     'MAX_WINDOW_HEIGHT',
+    'LOAD_RENDER_CHARS',
     'DEFAULT_FILTER_MODE',
     'MAX_FILTER_HISTORY',
+    'FILTER_HISTORY_LABEL_CHARS',
     'FILTER_DEBOUNCE_MS',
+    'FILTER_CHUNK_LINES',
+    'FILTER_QUEUE_CHUNKS',
+    'FILTER_DRAIN_MS',
     'THEME_NAMES',
     'CONFIG_DIR_WINDOWS',
     'CONFIG_DIR_UNIX',
     'CONFIG_FILENAME',
     'FILTER_PREFS_FILENAME',
     'ICON_DIR',
-    'ICON_EXTENSION'
+    'ICON_EXTENSION',
+    'format_size'
 ]
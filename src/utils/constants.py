@@ -16,11 +16,18 @@ BUILD_NUMBER = 17
 # Application defaults
 
 DEFAULT_REFRESH_MS = 500        # Default refresh interval in milliseconds
+POLL_BACKOFF_MAX_MS = 2000      # Longest poll interval reached while a file is idle
 DEFAULT_ENCODING = "auto"       # Default encoding (auto-detection enabled)
 DEFAULT_THEME = "dark"          # Default color theme
 
 # File handling constants
 MAX_FILE_SIZE_FOR_FULL_LOAD = 2 * 1024 * 1024  # 2MB - files larger than this start tailing from end
+ENCODING_SNIFF_BYTES = 4096     # Leading bytes examined by the UTF-16 NUL heuristic
+MMAP_READ_THRESHOLD = 8 * 1024 * 1024  # 8MB - files at least this large are read via mmap
+DIRECT_READ_THRESHOLD = 128 * 1024 * 1024  # 128MB - files at least this large bypass the page cache (Linux)
+FILE_WATCH_FALLBACK_SECONDS = 5  # Re-check interval for watched files in case events are missed
+ROTATION_CHECK_SECONDS = 2  # How often the log path is checked for a rotated/replaced file
+PROGRESS_REPORT_BYTES = 16 * 1024 * 1024  # 16MB - bytes read between file loading progress updates
 
 # UI constants
 MIN_WINDOW_WIDTH = 800
@@ -28,11 +35,16 @@ MIN_WINDOW_HEIGHT = 600
 MAX_WINDOW_WIDTH = 3000
 MAX_WINDOW_HEIGHT = 2000
 LINE_NUMBER_WIDTH = 8              # Width of line numbers panel
+LOAD_RENDER_CHARS = 64 * 1024      # Characters of a loaded file inserted per idle pass
 
 # Filter constants
 DEFAULT_FILTER_MODE = "contains"
 MAX_FILTER_HISTORY = 20
+FILTER_HISTORY_LABEL_CHARS = 50  # Longer history entries are shortened in the history menu
 FILTER_DEBOUNCE_MS = 150
+FILTER_CHUNK_LINES = 4096  # Lines filtered per chunk when rebuilding the view in the background
+FILTER_QUEUE_CHUNKS = 16  # Filtered chunks buffered between the filter thread and the UI
+FILTER_DRAIN_MS = 16  # How often the UI collects filtered chunks during a rebuild
 
 # Theme constants
 # All available themes - using single icon for all
@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""
+Formatting helpers for the Log Viewer application.
+
+Small text formatting functions shared by the managers and the UI.
+"""
+
+# Size units indexed by (bit_length - 1) // 10, i.e. by power of 1024
+_SIZE_UNITS = (("B", 1), ("KB", 1 << 10), ("MB", 1 << 20), ("GB", 1 << 30))
+
+
+def format_size(size_bytes: int) -> str:
+    """
+    Format a byte count in human-readable form.
+    
+    Args:
+        size_bytes: Size in bytes
+        
+    Returns:
+        Size with one decimal in the largest fitting unit, e.g. "2.0 MB"
+    """
+    size_bytes = int(size_bytes)
+    index = min(max((size_bytes.bit_length() - 1) // 10, 0), 3)
+    if index == 0:
+        return f"{size_bytes} B"
+    unit, divisor = _SIZE_UNITS[index]
+    return f"{size_bytes / divisor:.1f} {unit}"
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Checks for FileManager reading, rotation and encoding handling.
+
+Run with pytest, or directly with python.
+"""
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+
+from src.managers import FileManager
+
+
+def _write(path, data: bytes, mode="ab"):
+    with open(path, mode) as f:
+        f.write(data)
+
+
+def test_rotation_keeps_detected_encoding():
+    """A UTF-16 log replaced by an empty file is still decoded as UTF-16."""
+    directory = tempfile.mkdtemp()
+    try:
+        path = os.path.join(directory, "app.log")
+        _write(path, b"\xff\xfe" + "first line\n".encode("utf-16-le") * 20, "wb")
+
+        fm = FileManager(path, "auto")
+        fm.open()
+        assert fm.read_entire_file().endswith("first line\n")
+        fm.encoding = "auto"  # main.py restores the requested encoding after loading
+
+        # Rotate: move the log away and start an empty one under the same name
+        os.rename(path, path + ".1")
+        _write(path, b"", "wb")
+        fm._last_path_check = 0.0  # Let the periodic path check run now
+        assert fm.read_new_text() == ""
+
+        _write(path, "rotated\n".encode("utf-16-le"))
+        fm._last_full_check = 0.0
+        assert fm.read_new_text() == "rotated\n"
+        fm.close()
+    finally:
+        shutil.rmtree(directory)
+
+
+def test_same_size_rotation_seen_without_waiting():
+    """On Linux, inotify move/create events trigger the rotation check at once."""
+    if not sys.platform.startswith("linux"):
+        return
+    directory = tempfile.mkdtemp()
+    try:
+        path = os.path.join(directory, "app.log")
+        _write(path, b"old line\n", "wb")
+
+        fm = FileManager(path, "utf-8")
+        fm.open()
+        assert fm.read_entire_file() == "old line\n"
+        if fm.watch_fileno() is None:
+            return  # inotify unavailable here
+        fm._last_path_check = time.monotonic()  # The periodic check just ran
+
+        # Replace the log with a new file of exactly the same size
+        os.rename(path, path + ".1")
+        _write(path, b"new line\n", "wb")
+        assert fm.read_new_text() == "new line\n"
+        fm.close()
+    finally:
+        shutil.rmtree(directory)
+
+
+def test_multibyte_characters_split_across_reads():
+    """Characters split across read chunks or appends decode intact."""
+    directory = tempfile.mkdtemp()
+    try:
+        path = os.path.join(directory, "app.log")
+        text = "naïve café €5 😀 done\n" * 3
+        _write(path, text.encode("utf-8"), "wb")
+
+        # Buffered initial load with chunks smaller than one character
+        fm = FileManager(path, "utf-8")
+        fm.open()
+        assert fm.read_entire_file(chunk_size=3) == text
+
+        # Memory-mapped load, decoded in equally small steps
+        fm.open()
+        assert fm._read_mapped(3) == text
+
+        # Tailing: one character written in two appends
+        data = "é😀\n".encode("utf-8")
+        _write(path, data[:1])
+        fm._last_full_check = 0.0
+        assert fm.read_new_text() == ""
+        _write(path, data[1:4])
+        fm._last_full_check = 0.0
+        assert fm.read_new_text() == "é"
+        _write(path, data[4:])
+        fm._last_full_check = 0.0
+        assert fm.read_new_text() == "😀\n"
+        fm.close()
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    test_rotation_keeps_detected_encoding()
+    test_same_size_rotation_seen_without_waiting()
+    test_multibyte_characters_split_across_reads()
+    print("All file manager checks passed")
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Checks for FilterManager matching, batch filtering and streaming.
+
+Run with pytest, or directly with python.
+"""
+
+import re
+import queue
+
+from src.managers import FilterManager
+
+
+LINES = [
+    "ERROR disk full\n",
+    "warning: low memory\n",
+    "Straße closed\n",
+    "FILE not found\n",
+    "İstanbul error\n",
+    "ßtraße\n",
+    "info: started\n",
+    "\n",
+]
+
+
+def _reference(line: str, text: str, mode: str, case_sensitive: bool) -> bool:
+    """Straightforward per-mode matcher the fast paths must agree with."""
+    if mode == "regex":
+        return re.search(text, line, 0 if case_sensitive else re.IGNORECASE) is not None
+    if not case_sensitive:
+        line, text = line.casefold(), text.casefold()
+    if mode == "contains":
+        return text in line
+    if mode == "not_contains":
+        return text not in line
+    if mode == "starts_with":
+        return line.startswith(text)
+    if mode == "ends_with":
+        return line.endswith(text)
+    if mode == "exact":
+        return line == text
+    raise ValueError(mode)
+
+
+def test_filter_lines_matches_every_path():
+    """filter_lines, matches and fast_predicate agree with the reference."""
+    cases = [
+        ("error", "contains"), ("ERROR", "not_contains"), ("ss", "starts_with"),
+        ("err", "starts_with"), ("sß", "starts_with"), ("full\n", "ends_with"),
+        ("error|warning", "regex"), ("strasse|foo", "regex"), ("ﬁle|x", "regex"),
+        ("^info", "regex"), (r"e\w+", "regex"), (".*", "regex"),
+    ]
+    fm = FilterManager()
+    for case_sensitive in (False, True):
+        for text, mode in cases:
+            fm.set_filter(text, mode, case_sensitive)
+            expected = [line for line in LINES if _reference(line, text, mode, case_sensitive)]
+            assert fm.filter_lines(LINES) == expected, (text, mode, case_sensitive)
+            assert [line for line in LINES if fm.matches(line)] == expected
+            predicate = fm.fast_predicate()
+            assert [line for line in LINES if predicate(line)] == expected
+
+
+def test_literal_alternation_agrees_with_regex():
+    """Case-insensitive literal alternations match exactly what re does."""
+    fm = FilterManager()
+    fm.set_filter("strasse|foo", "regex", False)
+    assert not fm.matches("Straße closed")
+    fm.set_filter("ﬁle|x", "regex", False)
+    assert not fm.matches("FILE")
+    fm.set_filter("error|warn", "regex", False)
+    assert fm.matches("İstanbul ERROR")
+    assert fm.matches("a Warning")
+
+
+def test_prefix_path_agrees_with_casefold():
+    """Case-insensitive starts_with keeps casefold semantics."""
+    fm = FilterManager()
+    fm.set_filter("ss", "starts_with", False)
+    assert fm.matches("ßtraße")
+    fm.set_filter("sß", "starts_with", False)
+    assert fm.matches("ssss")
+    fm.set_filter("ERR", "starts_with", False)
+    assert fm.matches("error: x")
+    assert not fm.matches("an error")
+
+
+def test_numbered_filter_lines():
+    """Numbered results carry the line numbers from start."""
+    fm = FilterManager()
+    fm.set_filter("error", "contains", False)
+    assert fm.filter_lines(LINES, numbered=True, start=10) == [
+        (10, "ERROR disk full\n"), (14, "İstanbul error\n"),
+    ]
+
+
+def test_snapshot_is_detached():
+    """A snapshot keeps its filter when the manager changes afterwards."""
+    fm = FilterManager()
+    fm.set_filter("error", "contains", False)
+    snapshot = fm.snapshot()
+    fm.set_filter("warning", "regex", True)
+    assert snapshot.filter_lines(LINES) == ["ERROR disk full\n", "İstanbul error\n"]
+    assert snapshot.get_filter_history() == []
+
+
+def test_filter_stream_chunks():
+    """filter_stream publishes one result per chunk, then None."""
+    fm = FilterManager()
+    fm.set_filter("e", "contains", True)
+    results = queue.Queue()
+    fm.filter_stream(LINES, results, chunk_size=3, numbered=True, count=6)
+    chunks = []
+    while True:
+        chunk = results.get_nowait()
+        if chunk is None:
+            break
+        chunks.append(chunk)
+    assert len(chunks) == 2
+    assert [pair for chunk in chunks for pair in chunk] == fm.filter_lines(LINES[:6], numbered=True)
+    assert results.empty()
+
+
+if __name__ == "__main__":
+    test_filter_lines_matches_every_path()
+    test_literal_alternation_agrees_with_regex()
+    test_prefix_path_agrees_with_casefold()
+    test_numbered_filter_lines()
+    test_snapshot_is_detached()
+    test_filter_stream_chunks()
+    print("All filter manager checks passed")
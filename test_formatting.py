@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+"""
+Checks for the shared formatting helpers.
+
+Run with pytest, or directly with python.
+"""
+
+from src.utils import format_size
+
+
+def test_format_size_units():
+    """Sizes use the largest fitting unit with one rounded decimal."""
+    assert format_size(0) == "0 B"
+    assert format_size(1023) == "1023 B"
+    assert format_size(1024) == "1.0 KB"
+    assert format_size(1536) == "1.5 KB"
+    assert format_size(int(1.96 * 1024 * 1024)) == "2.0 MB"
+    assert format_size(100 * 1024 * 1024 - 1) == "100.0 MB"
+    assert format_size(5 * 1024 ** 3) == "5.0 GB"
+    assert format_size(3 * 1024 ** 4) == "3072.0 GB"
+
+
+if __name__ == "__main__":
+    test_format_size_units()
+    print("All formatting checks passed")